@@ -1,5 +1,7 @@
 # Standard Python Libraries
 from pathlib import Path
+from datetime import datetime
+from functools import cached_property
 from typing import Callable, NamedTuple, Optional
 
 
@@ -15,7 +17,11 @@ class TSharkCrashException(Exception):
 
 class Frame:
     def __init__(self, time_epoch: str):
-        self.datetime = converts_tshark_packet_timestamp_to_datetime_object(time_epoch)
+        self.time_epoch = float(time_epoch)
+
+    @cached_property
+    def datetime(self):
+        return datetime.fromtimestamp(self.time_epoch)
 
 class IP:
     def __init__(self, src: str, dst: str):
@@ -24,14 +30,33 @@ class IP:
 
 class UDP:
     def __init__(self, srcport: str, dstport: str):
-        self.srcport = int(srcport) if srcport else None
-        self.dstport = int(dstport) if dstport else None
+        self._srcport = srcport
+        self._dstport = dstport
+
+    @cached_property
+    def srcport(self):
+        return int(self._srcport) if self._srcport else None
+
+    @cached_property
+    def dstport(self):
+        return int(self._dstport) if self._dstport else None
 
 class Packet:
+    """The layers are only built when first accessed, so that packets filtered out early don't pay for parsing them."""
     def __init__(self, fields: PacketFields):
-        self.frame = Frame(fields.frame_time)
-        self.ip = IP(fields.src_ip, fields.dst_ip)
-        self.udp = UDP(fields.src_port, fields.dst_port)
+        self.fields = fields
+
+    @cached_property
+    def frame(self):
+        return Frame(self.fields.frame_time)
+
+    @cached_property
+    def ip(self):
+        return IP(self.fields.src_ip, self.fields.dst_ip)
+
+    @cached_property
+    def udp(self):
+        return UDP(self.fields.src_port, self.fields.dst_port)
 
 class PacketCapture:
     def __init__(
@@ -84,11 +109,15 @@ class PacketCapture:
         import queue
         import threading
 
-        packets_queue = queue.Queue()
+        packets_queue: queue.Queue[Optional[Packet]] = queue.Queue()
 
         def read_packets():
-            for packet in self._capture_packets():
-                packets_queue.put(packet)
+            try:
+                for packet in self._capture_packets():
+                    packets_queue.put(packet)
+            finally:
+                # Wakes up the consumer right away once the capture ends
+                packets_queue.put(None)
 
         stdout_thread = threading.Thread(target=read_packets, daemon=True)
         stdout_thread.start()
@@ -96,25 +125,22 @@ class PacketCapture:
         start_time = time.monotonic()
 
         while True:
-            time_elapsed = time.monotonic() - start_time
-            if time_elapsed >= timeout:
-                if packets_queue.empty():
-                    # NOTE: I don't use this code anyways, but returning `None` here seems like an issue to fix.
-                    callback('None')
-                else:
-                    while not packets_queue.empty():
-                        packet = packets_queue.get()
-                        callback(packet)
-
+            try:
+                packet = packets_queue.get(timeout=max(timeout - (time.monotonic() - start_time), 0))
+            except queue.Empty:
+                # NOTE: I don't use this code anyways, but returning `None` here seems like an issue to fix.
+                callback('None')
                 start_time = time.monotonic()
+                continue
 
-            time.sleep(0.1)
-
-            # Ensure that the stdout_thread completes before exiting the method
-            if not stdout_thread.is_alive():
+            if packet is None:
+                # Ensure that the stdout_thread completes before exiting the method
                 stdout_thread.join()
                 break
 
+            callback(packet)
+            start_time = time.monotonic()
+
     def apply_on_packets(self, callback: Callable[[Packet], None]):
         for packet in self._capture_packets():
             callback(packet)
@@ -122,32 +148,27 @@ class PacketCapture:
     def _capture_packets(self):
         import subprocess
 
-        def process_tshark_stdout(line: str):
-            fields = line.rstrip().split('|', 4)
-            return PacketFields(*fields) if len(fields) == 5 else None
+        def process_tshark_stdout(line: bytes):
+            # Split and check the raw bytes, so that only complete lines get decoded
+            fields = line.rstrip().split(b'|', 4)
+            if len(fields) != 5 or not all(fields[1:]):
+                return None
+            return PacketFields(*(field.decode("ascii") for field in fields))
 
         with subprocess.Popen(
             self._tshark_command,
             stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True
+            stderr=subprocess.PIPE
         ) as process:
             self._tshark_process = process
 
             # Iterate over stdout line by line as it is being produced
             for line in process.stdout:
-                if (packet_fields := process_tshark_stdout(line)) and all([
-                    packet_fields.src_ip, packet_fields.dst_ip, packet_fields.src_port, packet_fields.dst_port
-                ]):
+                if packet_fields := process_tshark_stdout(line):
                     yield Packet(packet_fields)
 
             # After stdout is done, check if there were any errors
-            stderr_output = process.stderr.read()
+            stderr_output = process.stderr.read().decode(errors="replace")
             if process.returncode != 0:
                 raise TSharkCrashException(f"TShark exited with error code {process.returncode}:\n{stderr_output.strip()}")
 
-
-def converts_tshark_packet_timestamp_to_datetime_object(packet_frame_time_epoch: str):
-    from datetime import datetime
-
-    return datetime.fromtimestamp(timestamp=float(packet_frame_time_epoch))
\ No newline at end of file
@@ -2,7 +2,7 @@
 from ipaddress import IPv4Address, AddressValueError
 
 # Local Python Libraries (Included with Project)
-from Modules.constants.standard import RE_MAC_ADDRESS_PATTERN
+from Modules.constants.standard import RE_MAC_ADDRESS_PATTERN, RE_IPV4_ADDRESS_PATTERN
 
 
 def is_mac_address(mac_address: str):
@@ -23,10 +23,7 @@ def get_mac_oui(mac_address: str, separator: str = ""):
     return separator.join(sanitized_mac[i:i+2] for i in range(0, 6, 2))
 
 def is_ipv4_address(ip_address: str):
-    try:
-        return IPv4Address(ip_address).version == 4
-    except AddressValueError:
-        return False
+    return bool(RE_IPV4_ADDRESS_PATTERN.fullmatch(ip_address))
 
 def is_private_device_ipv4(ip_address: str):
     return IPv4Address(ip_address).is_private
@@ -1,8 +1,12 @@
 # Standard Python Libraries
 from pathlib import Path
+from functools import lru_cache
 from typing import Optional, Literal, Union, Any
 
 
+_BOOLEAN_VALUES_BY_LOWERED_STRING = {"true": True, "false": False}
+
+
 class InvalidBooleanValueError(Exception):
     pass
 
@@ -13,23 +17,22 @@ class InvalidNoneTypeValueError(Exception):
 class Version:
     def __init__(self, version: str):
         from datetime import datetime
-        from Modules.constants.standard import RE_VERSION_TIME
+        from Modules.constants.standard import RE_VERSION_PATTERN
 
-        version = version.strip()
+        # A single match extracts every component, instead of running `strptime()` over the same slices several times
+        if not (match := RE_VERSION_PATTERN.match(version.strip())):
+            raise ValueError(f'Invalid version string: "{version}"')
 
-        self.major, self.minor, self.patch = map(int, version[1:6:2])
-        self.date = datetime.strptime(version[9:19], "%d/%m/%Y").date().strftime("%d/%m/%Y")
+        self.major, self.minor, self.patch = int(match["major"]), int(match["minor"]), int(match["patch"])
 
         # Check if the version string contains the time component
-        if (
-            len(version) == 27
-            and RE_VERSION_TIME.search(version)
-        ):
-            self.time = datetime.strptime(version[21:26], "%H:%M").time().strftime("%H:%M")
-            self.date_time = datetime.strptime(version[9:27], "%d/%m/%Y (%H:%M)")
+        if match["hour"] is not None:
+            self.date_time = datetime(int(match["year"]), int(match["month"]), int(match["day"]), int(match["hour"]), int(match["minute"]))
+            self.time = f"{self.date_time.hour:02}:{self.date_time.minute:02}"
         else:
+            self.date_time = datetime(int(match["year"]), int(match["month"]), int(match["day"]))
             self.time = None
-            self.date_time = datetime.strptime(version[9:19], "%d/%m/%Y")
+        self.date = f"{self.date_time.day:02}/{self.date_time.month:02}/{self.date_time.year:04}"
 
     def __str__(self):
         return f"v{self.major}.{self.minor}.{self.patch} - {self.date}{f' ({self.time})' if self.time else ''}"
@@ -88,23 +91,20 @@ def concat_lists_no_duplicates(*lists: list[Any]):
     Args:
         *lists: One or more lists to concatenate.
     """
-    unique_list: list[Any] = []
-    seen = set()
-
-    for lst in lists:
-        for item in lst:
-            if item not in seen:
-                unique_list.append(item)
-                seen.add(item)
+    from itertools import chain
 
-    return unique_list
+    # dict keys are unique and keep insertion order
+    return list(dict.fromkeys(chain.from_iterable(lists)))
 
 def get_pid_by_path(filepath: Path):
     import psutil
 
+    target_exe = str(filepath.absolute())
+
+    # `process_iter()` already skips processes that vanish mid-scan, and fills `info` with None when access is denied
     for process in psutil.process_iter(["pid", "exe"]):
-        if process.info["exe"] == str(filepath.absolute()):
-            return process.pid
+        if process.info["exe"] == target_exe:
+            return process.info["pid"]
     return None
 
 def is_file_need_newline_ending(file: Union[str, Path]):
@@ -116,7 +116,10 @@ def is_file_need_newline_ending(file: Union[str, Path]):
     if file_path.stat().st_size == 0:
         return False
 
-    return not file.read_bytes().endswith(b"\n")
+    # Only the last byte matters, so don't read the whole file
+    with file_path.open("rb") as f:
+        f.seek(-1, 2)
+        return f.read(1) != b"\n"
 
 def write_lines_to_file(file: Path, mode: Literal["w", "x", "a"], lines: list[str]):
     """
@@ -127,28 +130,24 @@ def write_lines_to_file(file: Path, mode: Literal["w", "x", "a"], lines: list[st
         mode: The file mode ('w', 'x' or 'a').
         lines: A list of lines to write to the file.
     """
-    # Copy the input lines to avoid modifying the original list
-    content = lines[:]
+    from itertools import islice
 
-    # If the content list is empty, exit early without writing to the file
-    if not content:
+    # If the lines list is empty, exit early without writing to the file
+    if not lines:
         return
 
-    # If appending to a file, ensure a leading newline is added if the file exists, otherwise creates it.
-    if mode == "a":
-        if file.is_file():
-            if is_file_need_newline_ending(file):
-                content.insert(0, "")
-        else:
-            file.touch()
+    # If appending to an existing file, ensure a leading newline is added (opening it in append mode otherwise creates it).
+    need_leading_newline = mode == "a" and file.is_file() and is_file_need_newline_ending(file)
 
-    # Ensure the last line ends with a newline character
-    if not content[-1].endswith("\n"):
-        content[-1] += "\n"
+    # Ensure the last line ends with a newline character, without copying or modifying the input list
+    last_line = lines[-1] if lines[-1].endswith("\n") else lines[-1] + "\n"
 
     # Write content to the file
     with file.open(mode, encoding="utf-8") as f:
-        f.writelines(content)
+        if need_leading_newline:
+            f.write("\n")
+        f.writelines(islice(lines, len(lines) - 1))
+        f.write(last_line)
 
 def terminate_process_tree(pid: int = None):
     """Terminates the process with the given PID and all its child processes.
@@ -174,6 +173,11 @@ def terminate_process_tree(pid: int = None):
     except psutil.NoSuchProcess:
         pass
 
+@lru_cache(maxsize=32)
+def _get_case_insensitive_lookup(custom_values: tuple[str, ...]):
+    """Returns the lowercased-to-original mapping and the exact values set of the given values, memoized per values tuple."""
+    return {value.lower(): value for value in custom_values}, frozenset(custom_values)
+
 def check_case_insensitive_and_exact_match(input_value: str, custom_values_list: list[str]):
     """
     Checks if the input value matches any string in the list case-insensitively, and whether it also matches exactly (case-sensitive).
@@ -185,20 +189,13 @@ def check_case_insensitive_and_exact_match(input_value: str, custom_values_list:
     - The second boolean is True if the exact case-sensitive match is found.
     - The third value is the correctly capitalized version of the matched string if found, otherwise None.
     """
-    case_insensitive_match = False
-    case_sensitive_match = False
-    normalized_match = None
+    lowered_values_lookup, exact_values = _get_case_insensitive_lookup(tuple(custom_values_list))
 
-    lowered_input_value = input_value.lower()
-    for value in custom_values_list:
-        if value.lower() == lowered_input_value:
-            case_insensitive_match = True
-            normalized_match = value
-            if value == input_value:
-                case_sensitive_match = True
-                break
+    if input_value in exact_values:
+        return True, True, input_value
 
-    return case_insensitive_match, case_sensitive_match, normalized_match
+    normalized_match = lowered_values_lookup.get(input_value.lower())
+    return normalized_match is not None, False, normalized_match
 
 def custom_str_to_bool(string: str, only_match_against: Optional[bool] = None):
     """
@@ -209,16 +206,7 @@ def custom_str_to_bool(string: str, only_match_against: Optional[bool] = None):
         string: The boolean string to be checked.
         only_match_against (optional): If provided, the only boolean value to match against.
     """
-    need_rewrite_current_setting = False
-    resolved_value = None
-
-    string_lower = string.lower()
-
-    if string_lower == "true":
-        resolved_value = True
-    elif string_lower == "false":
-        resolved_value = False
-
+    resolved_value = _BOOLEAN_VALUES_BY_LOWERED_STRING.get(string.lower())
     if resolved_value is None:
         raise InvalidBooleanValueError("Input is not a valid boolean value")
 
@@ -228,8 +216,8 @@ def custom_str_to_bool(string: str, only_match_against: Optional[bool] = None):
     ):
         raise InvalidBooleanValueError("Input does not match the specified boolean value")
 
-    if not string == str(resolved_value):
-        need_rewrite_current_setting = True
+    # Only the exact "True" / "False" spellings don't need to be rewritten
+    need_rewrite_current_setting = string != ("True" if resolved_value else "False")
 
     return resolved_value, need_rewrite_current_setting
 
@@ -10,6 +10,7 @@ import enum
 import errno
 import signal
 import shutil
+import socket
 import logging
 import hashlib
 import textwrap
@@ -19,6 +20,8 @@ import threading
 import subprocess
 import webbrowser
 from pathlib import Path
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from operator import attrgetter
 from datetime import datetime, timedelta
 from traceback import TracebackException
@@ -49,7 +52,7 @@ from PyQt6.QtGui import QBrush, QColor, QFont, QCloseEvent, QKeyEvent, QClipboar
 # -----------------------------------------------------
 # 📚 Local Python Libraries (Included with Project) 📚
 # -----------------------------------------------------
-from Modules.constants.standalone import TITLE, VERSION, TSHARK_RECOMMENDED_FULL_VERSION, TSHARK_RECOMMENDED_VERSION_NUMBER
+from Modules.constants.standalone import TITLE, VERSION, TSHARK_RECOMMENDED_FULL_VERSION, TSHARK_RECOMMENDED_VERSION_NUMBER, GUI_COLUMN_HEADERS_TOOLTIPS
 from Modules.constants.standard import SETTINGS_PATH
 from Modules.utils import Version
 from Modules.msgbox import MsgBox
@@ -76,6 +79,9 @@ logging.basicConfig(
 )
 logging.captureWarnings(True)
 
+# Runs the UserIP detection tasks. They never block: anything they have to wait for is polled by `process_pending_userip_tasks()`.
+userip_task_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="UserIPTask")
+
 
 class ExceptionInfo(NamedTuple):
     exc_type: Type[BaseException]
@@ -150,6 +156,8 @@ def terminate_script(
     if need_sleep:
         time.sleep(3)
 
+    userip_task_executor.shutdown(wait=False, cancel_futures=True)
+
     if should_terminate_gracefully():
         if force_terminate_errorlevel is False:
             errorlevel = 1 if terminate_method == "THREAD_RAISED" else 0
@@ -414,7 +422,7 @@ class Settings(DefaultSettings):
             if not corrected_line == line:
                 need_rewrite_ini = True
 
-            match = RE_SETTINGS_INI_PARSER_PATTERN.search(corrected_line)
+            match = RE_SETTINGS_INI_PARSER_PATTERN.match(corrected_line)
             if not match:
                 continue
             setting_name = match.group("key")
@@ -906,8 +914,8 @@ class Player_IPAPI:
     city:           Union[Literal["N/A", "..."], str]               = "..."
     district:       Union[Literal["N/A", "..."], str]               = "..."
     zip_code:       Union[Literal["N/A", "..."], str]               = "..."
-    lat:            Union[Literal["N/A", "..."], Union[float, int]] = "..."
-    lon:            Union[Literal["N/A", "..."], Union[float, int]] = "..."
+    lat:            Union[Literal["N/A", "..."], float]             = "..."
+    lon:            Union[Literal["N/A", "..."], float]             = "..."
     time_zone:      Union[Literal["N/A", "..."], str]               = "..."
     offset:         Union[Literal["N/A", "..."], int]               = "..."
     currency:       Union[Literal["N/A", "..."], str]               = "..."
@@ -945,6 +953,7 @@ class Player_Detection:
     time: Optional[str] = None
     date_time: Optional[str] = None
     as_processed_userip_task = False
+    is_candidate = False  # Whether the player's IP is listed in the UserIP databases
 
 class Player_UserIp:
     def __init__(self):
@@ -962,18 +971,20 @@ class Player_UserIp:
 @dataclass
 class Player_ModMenus:
     usernames: list[str] = field(default_factory=list)
+    usernames_set: set[str] = field(default_factory=set)  # Mirrors `usernames` for O(1) membership checks
 
 class Player:
     def __init__(self, ip: str, port: int, packet_datetime: datetime):
-        self.is_player_just_registered = True
         self._initialize(ip, port, packet_datetime)
 
     def _initialize(self, ip: str, port: int, packet_datetime: datetime):
         self.ip = ip
+        self.ip_sort_key = int.from_bytes(socket.inet_aton(ip), "big")  # Numeric IPv4 value, used for sorting by IP address
         self.rejoins = 0
         self.packets = 1
         self.total_packets = 1
         self.usernames: list[str] = []
+        self.usernames_sources: tuple[int, list[str]] = (0, [])  # (mod menus usernames count, UserIP usernames) that `usernames` was last built from
 
         self.reverse_dns = Player_ReverseDNS()
         self.pps = Player_PPS()
@@ -994,6 +1005,7 @@ class Player:
 
 class PlayersRegistry:
     players_registry: dict[str, Player] = {}
+    _registry_lock = threading.Lock()  # Serializes registrations with `UserIP_Databases.build()` swapping the UserIP IPs set
 
     _sorted_players_cache: list[Player] = []
     _cache_lock = threading.Lock()
@@ -1001,11 +1013,17 @@ class PlayersRegistry:
     # Constant for the default sort order
     DEFAULT_SORT_ORDER = "datetime.last_rejoin"
 
+    # Sort used to build `_sorted_players_cache`, as set by `start_cache_updater()`
+    _cache_sort_order = DEFAULT_SORT_ORDER
+    _cache_reverse = False
+
     @classmethod
     def add_player(cls, player: Player):
-        if player.ip in cls.players_registry:
-            raise ValueError(f'Player with IP "{player.ip}" already exists.')
-        cls.players_registry[player.ip] = player
+        with cls._registry_lock:
+            if player.ip in cls.players_registry:
+                raise ValueError(f'Player with IP "{player.ip}" already exists.')
+            player.userip.detection.is_candidate = player.ip in UserIP_Databases.ips_set
+            cls.players_registry[player.ip] = player
         return player
 
     @classmethod
@@ -1023,15 +1041,20 @@ class PlayersRegistry:
             yield player
 
     @classmethod
-    def _update_sorted_cache(cls, sort_order: str = DEFAULT_SORT_ORDER, reverse = False):
+    def refresh_sorted_cache(cls):
+        """Rebuild the cached sorted player list right away, so that newly registered players are included."""
+        with cls._cache_lock:
+            cls._sorted_players_cache = sorted(
+                list(cls.players_registry.values()),
+                key=attrgetter(cls._cache_sort_order),
+                reverse=cls._cache_reverse
+            )
+
+    @classmethod
+    def _update_sorted_cache(cls):
         """Refresh the cached sorted player list every second."""
         while not gui_closed__event.is_set():
-            with cls._cache_lock:
-                cls._sorted_players_cache = sorted(
-                    cls.players_registry.values(),
-                    key=attrgetter(sort_order),
-                    reverse=reverse
-                )
+            cls.refresh_sorted_cache()
             gui_closed__event.wait(1)  # Sleep for 1 second
 
     @classmethod
@@ -1047,13 +1070,15 @@ class PlayersRegistry:
     @classmethod
     def start_cache_updater(cls, sort_order: str = DEFAULT_SORT_ORDER, reverse = False):
         """Start the background thread to update the player cache."""
-        thread = threading.Thread(target=cls._update_sorted_cache, args=(sort_order, reverse), daemon=True)
+        cls._cache_sort_order = sort_order
+        cls._cache_reverse = reverse
+        thread = threading.Thread(target=cls._update_sorted_cache, daemon=True)
         thread.start()
 
 class SessionHost:
     player: Optional[Player] = None
     search_player = False
-    players_pending_for_disconnection: list[Player] = []
+    players_pending_for_disconnection: set[Player] = set()
 
     @staticmethod
     def get_host_player(session_connected: list[Player]):
@@ -1112,7 +1137,7 @@ class UserIP_Databases:
 
     userip_databases: list[tuple[Path, UserIP_Settings, dict[str, list[str]]]] = []
     userip_infos_by_ip: dict[str, UserIP] = {}
-    ips_set: set[str] = set()
+    ips_set: frozenset[str] = frozenset()
     notified_settings_corrupted: set[Path] = set()
     notified_ip_invalid: set[str] = set()
     notified_ip_conflicts: set[str] = set()
@@ -1166,7 +1191,6 @@ class UserIP_Databases:
         with cls._update_userip_database_lock:
             userip_infos_by_ip: dict[str, UserIP] = {}
             unresolved_conflicts: set[str] = set()
-            ips_set: set[str] = set()
 
             for database_path, settings, user_ips in cls.userip_databases:
                 for username, ips in user_ips.items():
@@ -1178,7 +1202,6 @@ class UserIP_Databases:
                                 settings = settings,
                                 usernames = [username]
                             )
-                            ips_set.add(ip)
 
                         if not userip_infos_by_ip[ip].database_path == database_path:
                             if ip not in cls.notified_ip_conflicts:
@@ -1194,8 +1217,16 @@ class UserIP_Databases:
             for resolved_ip in resolved_conflicts:
                 cls.notified_ip_conflicts.remove(resolved_ip)
 
-            cls.userip_infos_by_ip = userip_infos_by_ip
-            cls.ips_set = ips_set
+            ips_set = frozenset(userip_infos_by_ip)
+
+            # Swap and recompute under the registry lock, so that no player gets registered with a flag computed from the previous set
+            with PlayersRegistry._registry_lock:
+                cls.userip_infos_by_ip = userip_infos_by_ip
+                cls.ips_set = ips_set
+
+                # Recompute the UserIP candidate flag of already registered players
+                for player in PlayersRegistry.players_registry.values():
+                    player.userip.detection.is_candidate = player.ip in ips_set
 
     @classmethod
     def get_userip_database_filepaths(cls):
@@ -1216,7 +1247,8 @@ class UserIP_Databases:
         Args:
             player: The player object with 'ip' and 'userip' attributes.
         """
-        if userip_info := cls.get_userip_info(player.ip):
+        # `userip_infos_by_ip` is only ever swapped as a whole by `build()`, so a single lookup doesn't need the lock.
+        if userip_info := cls.userip_infos_by_ip.get(player.ip):
             player.userip.database_path = userip_info.database_path
             player.userip.settings = userip_info.settings
             player.userip.usernames = userip_info.usernames
@@ -1361,7 +1393,7 @@ def update_and_initialize_geolite2_readers():
                 "last_version": None,
                 "download_url": None
             }
-            for db in ("ASN", "City", "Country")
+            for db in ("ASN", "City")  # The City database also carries the country, so the Country one isn't needed
         }
 
         try:
@@ -1498,24 +1530,21 @@ def update_and_initialize_geolite2_readers():
         try:
             geolite2_asn_reader = geoip2.database.Reader(GEOLITE2_DATABASES_FOLDER_PATH / "GeoLite2-ASN.mmdb")
             geolite2_city_reader = geoip2.database.Reader(GEOLITE2_DATABASES_FOLDER_PATH / "GeoLite2-City.mmdb")
-            geolite2_country_reader = geoip2.database.Reader(GEOLITE2_DATABASES_FOLDER_PATH / "GeoLite2-Country.mmdb")
 
             geolite2_asn_reader.asn("1.1.1.1")
             geolite2_city_reader.city("1.1.1.1")
-            geolite2_country_reader.country("1.1.1.1")
         except Exception as e:
             geolite2_asn_reader = None
             geolite2_city_reader = None
-            geolite2_country_reader = None
 
             exception = e
         else:
             exception = None
 
-        return exception, geolite2_asn_reader, geolite2_city_reader, geolite2_country_reader
+        return exception, geolite2_asn_reader, geolite2_city_reader
 
     update_geolite2_databases__dict = update_geolite2_databases()
-    exception__initialize_geolite2_readers, geolite2_asn_reader, geolite2_city_reader, geolite2_country_reader = initialize_geolite2_readers()
+    exception__initialize_geolite2_readers, geolite2_asn_reader, geolite2_city_reader = initialize_geolite2_readers()
 
     show_error = False
     msgbox_message = ""
@@ -1545,7 +1574,7 @@ def update_and_initialize_geolite2_readers():
         msgbox_style = MsgBox.Style.OKOnly | MsgBox.Style.Exclamation | MsgBox.Style.MsgBoxSetForeground
         MsgBox.show(msgbox_title, msgbox_message, msgbox_style)
 
-    return geoip2_enabled, geolite2_asn_reader, geolite2_city_reader, geolite2_country_reader
+    return geoip2_enabled, geolite2_asn_reader, geolite2_city_reader
 
 
 colorama.init(autoreset=True)
@@ -1765,9 +1794,9 @@ while True:
 del BIN_PATH, GITHUB_RELEASES_URL
 
 cls()
-title(f"Initializing and updating MaxMind's GeoLite2 Country, City and ASN databases - {TITLE}")
-print("\nInitializing and updating MaxMind's GeoLite2 Country, City and ASN databases ...\n")
-geoip2_enabled, geolite2_asn_reader, geolite2_city_reader, geolite2_country_reader = update_and_initialize_geolite2_readers()
+title(f"Initializing and updating MaxMind's GeoLite2 City and ASN databases - {TITLE}")
+print("\nInitializing and updating MaxMind's GeoLite2 City and ASN databases ...\n")
+geoip2_enabled, geolite2_asn_reader, geolite2_city_reader = update_and_initialize_geolite2_readers()
 
 cls()
 title(f"Initializing MacLookup module - {TITLE}")
@@ -2123,52 +2152,64 @@ capture = PacketCapture(
 )
 
 gui_closed__event = threading.Event()
+rendering_core__wakeup_event = threading.Event()  # Set when a player joins or rejoins, so the session tables are rendered without waiting for the next tick
 
-def process_userip_task(
-    player: Player,
-    connection_type: Literal["connected", "disconnected"],
-    *,  # Prevents further positional arguments
-    _userip_logging_file_write_lock=threading.Lock()  # Internal static lock
-    ):
+class UserIP_PendingTasks:
+    """
+    Follow-ups of the UserIP detection tasks that have to wait on a condition.
+    They are polled by `process_pending_userip_tasks()` instead of sleeping in `userip_task_executor` workers.
+    """
+    _lock = threading.Lock()
 
-    with Threads_ExceptionHandler():
-        def suspend_process_for_duration_or_mode(process_pid: int, duration_or_mode: Union[int, float, Literal["Auto", "Manual"]]):
-            """
-            Suspends the specified process for a given duration or until a specified condition is met.
-
-            ### Parameters:
-            * process_pid: The process ID of the process to be suspended.
-            * duration_or_mode:
-                - If an integer or float, it specifies the duration (in seconds) to suspend the process.
-                - If set to \"Manual\", the process will be suspended indefinitely until the user manually resume it.
-                - If set to \"Auto\", the process will be suspended until the player is flagged as \"disconnected\", after which it is resumed automatically.
-            """
-            process = psutil.Process(process_pid)
-            process.suspend()
+    suspended_processes: list[tuple[psutil.Process, Player, Union[float, Literal["Auto"]]]] = []  # The resume deadline (monotonic time), or "Auto" to resume when the player leaves
+    players_pending_logging: list[Player] = []
+    players_pending_notification: list[tuple[Player, Path]] = []
 
-            if isinstance(duration_or_mode, (int, float)):
-                gui_closed__event.wait(duration_or_mode)
-                process.resume()
-                return
+    @classmethod
+    def add_suspended_process(cls, process: psutil.Process, player: Player, resume_condition: Union[float, Literal["Auto"]]):
+        with cls._lock:
+            cls.suspended_processes.append((process, player, resume_condition))
 
-            if duration_or_mode == "Manual":
-                return
-            elif duration_or_mode == "Auto":
-                while not player.datetime.left:
-                    gui_closed__event.wait(0.1)
-                process.resume()
-                return
+    @classmethod
+    def add_player_pending_logging(cls, player: Player):
+        with cls._lock:
+            cls.players_pending_logging.append(player)
+
+    @classmethod
+    def add_player_pending_notification(cls, player: Player, relative_database_path: Path):
+        with cls._lock:
+            cls.players_pending_notification.append((player, relative_database_path))
 
-        from Modules.constants.standard import USERIP_LOGGING_PATH
+    @classmethod
+    def pop_all(cls):
+        with cls._lock:
+            pending_tasks = (cls.suspended_processes, cls.players_pending_logging, cls.players_pending_notification)
+            cls.suspended_processes, cls.players_pending_logging, cls.players_pending_notification = [], [], []
+        return pending_tasks
+
+def is_userip_detection_still_awaited(player: Player):
+    """Returns whether a connected UserIP player is still worth waiting on for its lookups (at most 10 seconds after its last packet)."""
+    return not gui_closed__event.is_set() and not player.datetime.left and (datetime.now() - player.datetime.last_seen) < timedelta(seconds=10)
+
+def process_userip_task(player: Player, connection_type: Literal["connected", "disconnected"]):
+    with Threads_ExceptionHandler():
         from Modules.constants.local import TTS_PATH
-        from Modules.utils import get_pid_by_path, terminate_process_tree, write_lines_to_file
+        from Modules.utils import get_pid_by_path, terminate_process_tree
 
         # We wants to run this as fast as possible so it's on top of the function.
         if connection_type == "connected":
             if player.userip.settings.PROTECTION:
                 if player.userip.settings.PROTECTION == "Suspend_Process":
                     if process_pid := get_pid_by_path(player.userip.settings.PROTECTION_PROCESS_PATH):
-                        threading.Thread(target=suspend_process_for_duration_or_mode, args=(process_pid, player.userip.settings.PROTECTION_SUSPEND_PROCESS_MODE), daemon=True).start()
+                        process = psutil.Process(process_pid)
+                        process.suspend()
+
+                        # "Manual" stays suspended until the user resumes it, the others are resumed by `process_pending_userip_tasks()`
+                        duration_or_mode: Union[int, float, Literal["Auto", "Manual"]] = player.userip.settings.PROTECTION_SUSPEND_PROCESS_MODE
+                        if isinstance(duration_or_mode, (int, float)):
+                            UserIP_PendingTasks.add_suspended_process(process, player, time.monotonic() + duration_or_mode)
+                        elif duration_or_mode == "Auto":
+                            UserIP_PendingTasks.add_suspended_process(process, player, "Auto")
                 elif player.userip.settings.PROTECTION in ("Exit_Process", "Restart_Process"):
                     if isinstance(player.userip.settings.PROTECTION_PROCESS_PATH, Path):
                         if process_pid := get_pid_by_path(player.userip.settings.PROTECTION_PROCESS_PATH):
@@ -2196,57 +2237,99 @@ def process_userip_task(
             winsound.PlaySound(tts_file_path, winsound.SND_FILENAME | winsound.SND_ASYNC | winsound.SND_NODEFAULT)
 
         if connection_type == "connected":
-            while not player.datetime.left and (datetime.now() - player.datetime.last_seen) < timedelta(seconds=10):
-                if player.userip.usernames and player.iplookup.geolite2.is_initialized:
-                    break
-                gui_closed__event.wait(0.1)
-            else:
-                return
+            # The usernames and GeoLite2 lookup may not be ready yet, so the logging is done once they are
+            UserIP_PendingTasks.add_player_pending_logging(player)
 
-            from Modules.constants.standard import USERIP_DATABASES_PATH
-            relative_database_path = player.userip.database_path.relative_to(USERIP_DATABASES_PATH).with_suffix("")
-
-            with _userip_logging_file_write_lock:
-                write_lines_to_file(USERIP_LOGGING_PATH, "a", [(
-                    f"User{pluralize(len(player.userip.usernames))}:{', '.join(player.userip.usernames)} | "
-                    f"IP:{player.ip} | Ports:{', '.join(map(str, reversed(player.ports.list)))} | "
-                    f"Time:{player.userip.detection.date_time} | Country:{player.iplookup.geolite2.country} | "
-                    f"Detection Type: {player.userip.detection.type} | "
-                    f"Database:{relative_database_path}"
-                )])
-
-            if player.userip.settings.NOTIFICATIONS:
-                while not player.datetime.left and (datetime.now() - player.datetime.last_seen) < timedelta(seconds=10):
-                    if player.iplookup.ipapi.is_initialized:
-                        break
-                    gui_closed__event.wait(0.1)
-                else:
-                    return
+def submit_userip_task(player: Player, connection_type: Literal["connected", "disconnected"]):
+    """Submits a UserIP task, unless the GUI is closed (`terminate_script()` then shuts the executor down)."""
+    if not gui_closed__event.is_set():
+        userip_task_executor.submit(process_userip_task, player, connection_type)
+
+def log_userip_detection(
+    player: Player,
+    *,  # Prevents further positional arguments
+    _userip_logging_file_write_lock=threading.Lock()  # Internal static lock
+    ):
+    with Threads_ExceptionHandler():
+        from Modules.constants.standard import USERIP_DATABASES_PATH, USERIP_LOGGING_PATH
+        from Modules.utils import write_lines_to_file
+
+        relative_database_path = player.userip.database_path.relative_to(USERIP_DATABASES_PATH).with_suffix("")
+
+        with _userip_logging_file_write_lock:
+            write_lines_to_file(USERIP_LOGGING_PATH, "a", [(
+                f"User{pluralize(len(player.userip.usernames))}:{', '.join(player.userip.usernames)} | "
+                f"IP:{player.ip} | Ports:{', '.join(map(str, reversed(player.ports.list)))} | "
+                f"Time:{player.userip.detection.date_time} | Country:{player.iplookup.geolite2.country} | "
+                f"Detection Type: {player.userip.detection.type} | "
+                f"Database:{relative_database_path}"
+            )])
+
+        if player.userip.settings.NOTIFICATIONS:
+            # The notification also shows the IP-API lookup, which may not be ready yet
+            UserIP_PendingTasks.add_player_pending_notification(player, relative_database_path)
+
+def show_userip_detection_notification(player: Player, relative_database_path: Path):
+    msgbox_title = TITLE
+    msgbox_message = textwrap.indent(textwrap.dedent(f"""
+        #### UserIP detected at {player.userip.detection.time} ####
+        User{pluralize(len(player.userip.usernames))}: {', '.join(player.userip.usernames)}
+        IP: {player.ip}
+        Port{pluralize(len(player.ports.list))}: {', '.join(map(str, reversed(player.ports.list)))}
+        Country Code: {player.iplookup.geolite2.country_code}
+        Detection Type: {player.userip.detection.type}
+        Database: {relative_database_path}
+        ############# IP Lookup ##############
+        Continent: {player.iplookup.ipapi.continent}
+        Country: {player.iplookup.geolite2.country}
+        Region: {player.iplookup.ipapi.region}
+        City: {player.iplookup.geolite2.city}
+        Organization: {player.iplookup.ipapi.org}
+        ISP: {player.iplookup.ipapi.isp}
+        ASN / ISP: {player.iplookup.geolite2.asn}
+        ASN: {player.iplookup.ipapi.as_name}
+        Mobile (cellular) connection: {player.iplookup.ipapi.mobile}
+        Proxy, VPN or Tor exit address: {player.iplookup.ipapi.proxy}
+        Hosting, colocated or data center: {player.iplookup.ipapi.hosting}
+    """.removeprefix("\n").removesuffix("\n")), "    ")
+    msgbox_style = MsgBox.Style.OKOnly | MsgBox.Style.Exclamation | MsgBox.Style.SystemModal | MsgBox.Style.MsgBoxSetForeground
+    threading.Thread(target=MsgBox.show, args=(msgbox_title, msgbox_message, msgbox_style), daemon=True).start()
+
+def process_pending_userip_tasks():
+    """
+    Resumes the suspended processes and runs the UserIP logging and notifications whose condition is met, dropping the expired ones.
+    Called by `rendering_core()` at every render, and once more when the GUI is closed, which resumes every suspended process.
+    """
+    suspended_processes, players_pending_logging, players_pending_notification = UserIP_PendingTasks.pop_all()
+
+    for process, player, resume_condition in suspended_processes:
+        if (
+            gui_closed__event.is_set()
+            or (resume_condition == "Auto" and player.datetime.left)
+            or (isinstance(resume_condition, float) and time.monotonic() >= resume_condition)
+        ):
+            try:
+                process.resume()
+            except psutil.NoSuchProcess:
+                pass  # The process exited in the meantime, there is nothing to resume.
+        else:
+            UserIP_PendingTasks.add_suspended_process(process, player, resume_condition)
+
+    for player in players_pending_logging:
+        if not is_userip_detection_still_awaited(player):
+            continue
+        if player.userip.usernames and player.iplookup.geolite2.is_initialized:
+            userip_task_executor.submit(log_userip_detection, player)
+        else:
+            UserIP_PendingTasks.add_player_pending_logging(player)
 
-                msgbox_title = TITLE
-                msgbox_message = textwrap.indent(textwrap.dedent(f"""
-                    #### UserIP detected at {player.userip.detection.time} ####
-                    User{pluralize(len(player.userip.usernames))}: {', '.join(player.userip.usernames)}
-                    IP: {player.ip}
-                    Port{pluralize(len(player.ports.list))}: {', '.join(map(str, reversed(player.ports.list)))}
-                    Country Code: {player.iplookup.geolite2.country_code}
-                    Detection Type: {player.userip.detection.type}
-                    Database: {relative_database_path}
-                    ############# IP Lookup ##############
-                    Continent: {player.iplookup.ipapi.continent}
-                    Country: {player.iplookup.geolite2.country}
-                    Region: {player.iplookup.ipapi.region}
-                    City: {player.iplookup.geolite2.city}
-                    Organization: {player.iplookup.ipapi.org}
-                    ISP: {player.iplookup.ipapi.isp}
-                    ASN / ISP: {player.iplookup.geolite2.asn}
-                    ASN: {player.iplookup.ipapi.as_name}
-                    Mobile (cellular) connection: {player.iplookup.ipapi.mobile}
-                    Proxy, VPN or Tor exit address: {player.iplookup.ipapi.proxy}
-                    Hosting, colocated or data center: {player.iplookup.ipapi.hosting}
-                """.removeprefix("\n").removesuffix("\n")), "    ")
-                msgbox_style = MsgBox.Style.OKOnly | MsgBox.Style.Exclamation | MsgBox.Style.SystemModal | MsgBox.Style.MsgBoxSetForeground
-                threading.Thread(target=MsgBox.show, args=(msgbox_title, msgbox_message, msgbox_style), daemon=True).start()
+    for player, relative_database_path in players_pending_notification:
+        if not is_userip_detection_still_awaited(player):
+            continue
+        if player.iplookup.ipapi.is_initialized:
+            show_userip_detection_notification(player, relative_database_path)
+        else:
+            UserIP_PendingTasks.add_player_pending_notification(player, relative_database_path)
 
 def iplookup_core():
     with Threads_ExceptionHandler():
@@ -2278,6 +2361,32 @@ def iplookup_core():
 
             return result
 
+        IPAPI_FIELD_MAPPINGS: dict[str, tuple[str, tuple[Type[Any], ...]]] = {
+            "continent": ("continent", str),
+            "continent_code": ("continentCode", str),
+            "country": ("country", str),
+            "country_code": ("countryCode", str),
+            "region": ("regionName", str),
+            "region_code": ("region", str),
+            "city": ("city", str),
+            "district": ("district", str),
+            "zip_code": ("zip", str),
+            "time_zone": ("timezone", str),
+            "offset": ("offset", int),
+            "currency": ("currency", str),
+            "isp": ("isp", str),
+            "org": ("org", str),
+            "_as": ("as", str),
+            "as_name": ("asname", str),
+            "mobile": ("mobile", bool),
+            "proxy": ("proxy", bool),
+            "hosting": ("hosting", bool),
+        }
+        IPAPI_COORDINATE_FIELD_MAPPINGS: dict[str, str] = {
+            "lat": "lat",
+            "lon": "lon",
+        }
+
         while not gui_closed__event.is_set():
             if ScriptControl.has_crashed():
                 return
@@ -2314,7 +2423,7 @@ def iplookup_core():
                     continue
                 raise  # Re-raise other HTTP errors
 
-            iplookup_results: list[dict[str, Any]] = response.json()
+            iplookup_results: list[dict[str, Any]] = json.loads(response.content)
             if not isinstance(iplookup_results, list):
                 raise TypeError(f'Expected "list" object, got "{type(iplookup_results).__name__}"')
 
@@ -2329,33 +2438,17 @@ def iplookup_core():
                 if player := PlayersRegistry.get_player(player_ip):
                     player.iplookup.ipapi.is_initialized = True
 
-                    field_mappings: dict[str, tuple[str, tuple[Type[Any], ...]]] = {
-                        "continent": ("continent", str),
-                        "continent_code": ("continentCode", str),
-                        "country": ("country", str),
-                        "country_code": ("countryCode", str),
-                        "region": ("regionName", str),
-                        "region_code": ("region", str),
-                        "city": ("city", str),
-                        "district": ("district", str),
-                        "zip_code": ("zip", str),
-                        "lat": ("lat", (float, int)),
-                        "lon": ("lon", (float, int)),
-                        "time_zone": ("timezone", str),
-                        "offset": ("offset", int),
-                        "currency": ("currency", str),
-                        "isp": ("isp", str),
-                        "org": ("org", str),
-                        "_as": ("as", str),
-                        "as_name": ("asname", str),
-                        "mobile": ("mobile", bool),
-                        "proxy": ("proxy", bool),
-                        "hosting": ("hosting", bool),
-                    }
-
-                    for attr, (field, field_type) in field_mappings.items():
+                    for attr, (field, field_type) in IPAPI_FIELD_MAPPINGS.items():
                         setattr(player.iplookup.ipapi, attr, validate_and_get_field(player_ip, iplookup, field, field_type))
 
+                    # Coordinates are coerced to float as both "float" and "int" are sent by the API
+                    for attr, field in IPAPI_COORDINATE_FIELD_MAPPINGS.items():
+                        value = iplookup.get(field, "N/A")
+                        try:
+                            setattr(player.iplookup.ipapi, attr, value if value == "N/A" else float(value))
+                        except (TypeError, ValueError):
+                            raise TypeError(f'Expected "float" or "int" for "{field}", got "{type(value).__name__}" ({player_ip})') from None
+
             throttle_until(int(response.headers["X-Rl"]), int(response.headers["X-Ttl"]))
 
 def hostname_core():
@@ -2463,16 +2556,26 @@ def pinger_core():
 
 def capture_core():
     with Threads_ExceptionHandler():
+        def process_userip_detection(player: Player, packet_datetime: datetime):
+            player.userip.detection.as_processed_userip_task = True
+            player.userip.detection.type = "Static IP"
+            player.userip.detection.time = packet_datetime.strftime("%H:%M:%S")
+            player.userip.detection.date_time = packet_datetime.strftime("%Y-%m-%d_%H:%M:%S")
+            if UserIP_Databases.update_player_userip_info(player):
+                submit_userip_task(player, "connected")
+
         def packet_callback(packet: Packet):
             from Modules.networking.utils import is_private_device_ipv4
 
-            global tshark_restarted_times, global_pps_counter
-
-            packet_datetime = packet.frame.datetime
+            global tshark_restarted_times, global_pps_counter, tshark_packets_latencies_sum
 
-            packet_latency = datetime.now() - packet_datetime
-            tshark_packets_latencies.append((packet_datetime, packet_latency))
-            if packet_latency >= timedelta(seconds=Settings.CAPTURE_OVERFLOW_TIMER):
+            packet_latency = time.time() - packet.frame.time_epoch
+            with tshark_packets_latencies_lock:
+                if len(tshark_packets_latencies) == tshark_packets_latencies.maxlen:
+                    tshark_packets_latencies_sum -= tshark_packets_latencies[0][1]
+                tshark_packets_latencies.append((packet.frame.time_epoch, packet_latency))
+                tshark_packets_latencies_sum += packet_latency
+            if packet_latency >= Settings.CAPTURE_OVERFLOW_TIMER:
                 tshark_restarted_times += 1
                 raise PacketCaptureOverflow("Packet capture time exceeded 3 seconds.")
 
@@ -2503,26 +2606,24 @@ def capture_core():
             if target_port is None:
                 return  # A packet port was not found.
 
+            packet_datetime = packet.frame.datetime
+
             global_pps_counter += 1
 
             player = PlayersRegistry.get_player(target_ip)
             if player is None:
+                # The player was just registered from this packet, so there is nothing else to update.
                 player = PlayersRegistry.add_player(
                     Player(target_ip, target_port, packet_datetime)
                 )
-
-            if target_ip in UserIP_Databases.ips_set and not player.userip.detection.as_processed_userip_task:
-                player.userip.detection.as_processed_userip_task = True
-                player.userip.detection.type = "Static IP"
-                player.userip.detection.time = packet_datetime.strftime("%H:%M:%S")
-                player.userip.detection.date_time = packet_datetime.strftime("%Y-%m-%d_%H:%M:%S")
-                if UserIP_Databases.update_player_userip_info(player):
-                    threading.Thread(target=process_userip_task, args=(player, "connected"), daemon=True).start()
-
-            if player.is_player_just_registered:
-                player.is_player_just_registered = False
+                rendering_core__wakeup_event.set()
+                if player.userip.detection.is_candidate:
+                    process_userip_detection(player, packet_datetime)
                 return
 
+            if player.userip.detection.is_candidate and not player.userip.detection.as_processed_userip_task:
+                process_userip_detection(player, packet_datetime)
+
             # No matter what:
             player.datetime.last_seen = packet_datetime
             player.total_packets += 1
@@ -2534,6 +2635,7 @@ def capture_core():
                 player.datetime.last_rejoin = packet_datetime
                 player.rejoins += 1
                 player.packets = 1
+                rendering_core__wakeup_event.set()
 
                 if Settings.GUI_RESET_PORTS_ON_REJOINS:
                     player.ports.reset(target_port)
@@ -2556,7 +2658,9 @@ def capture_core():
             except PacketCaptureOverflow:
                 continue
 
-tshark_packets_latencies: list[tuple[datetime, timedelta]] = []
+tshark_packets_latencies: deque[tuple[float, float]] = deque(maxlen=4096)  # (packet epoch timestamp, packet latency in seconds)
+tshark_packets_latencies_sum = 0.0  # Running sum of the latencies (in seconds) currently held in `tshark_packets_latencies`
+tshark_packets_latencies_lock = threading.Lock()
 
 class CellColor(NamedTuple):
     foreground: QColor
@@ -2600,6 +2704,7 @@ class GUIrenderingData(metaclass=ThreadSafeMeta):
     session_disconnected_sorted_column_name: Optional[str] = None
     session_disconnected_sort_order: Optional[Qt.SortOrder] = None
 
+    gui_field_names_ready_event: threading.Event = threading.Event()
     gui_rendering_ready_event: threading.Event = threading.Event()
 
 def rendering_core():
@@ -2615,14 +2720,8 @@ def rendering_core():
                 for field_name in Settings.gui_all_disconnected_fields
                 if field_name not in GUIrenderingData.FIELDS_TO_HIDE
             ]
-            logging_connected_players_table__field_names = [
-                field_name
-                for field_name in Settings.gui_all_connected_fields
-            ]
-            logging_disconnected_players_table__field_names = [
-                field_name
-                for field_name in Settings.gui_all_disconnected_fields
-            ]
+            logging_connected_players_table__field_names = tuple(Settings.gui_all_connected_fields)
+            logging_disconnected_players_table__field_names = tuple(Settings.gui_all_disconnected_fields)
 
             return (
                 gui_connected_players_table__field_names,
@@ -2673,11 +2772,9 @@ def rendering_core():
                     reverse=sort_order_to_reverse(sort_order)
                 )
             elif sorted_column_name == "IP Address":
-                import ipaddress
-
                 return sorted(
                     session_list,
-                    key=lambda player: ipaddress.ip_address(player.ip),
+                    key=attrgetter("ip_sort_key"),
                     reverse=sort_order_to_reverse(sort_order)
                 )
             elif sorted_column_name in ("First Seen", "Last Rejoin", "Last Seen"):
@@ -2701,6 +2798,34 @@ def rendering_core():
                     reverse=sort_order_to_reverse(sort_order)
                 )
 
+        # Msgbox templates of `parse_userip_ini_file()`, dedented and indented once
+        USERIP_CORRUPTED_SETTING_MSGBOX_TEMPLATE = textwrap.indent(textwrap.dedent("""
+            ERROR:
+                Corrupted UserIP Database File (Settings)
+
+            INFOS:
+                UserIP database file:
+                \"{ini_path}\"
+                has an invalid settings value:
+
+                {setting}={value}
+
+                For more information on formatting, please refer to the
+                documentation:
+                https://github.com/BUZZARDGTA/Session-Sniffer?tab=readme-ov-file#userip_ini_databases_tutorial
+        """.removeprefix("\n").removesuffix("\n")), "    ")
+        USERIP_INVALID_IP_MSGBOX_TEMPLATE = textwrap.indent(textwrap.dedent("""
+            ERROR:
+                UserIP databases invalid IP address
+
+            INFOS:
+                The IP address from an entry is invalid (not an IP address).
+
+            DEBUG:
+                \"{ini_path}\":
+                {username}={ip}
+        """.removeprefix("\n").removesuffix("\n")), "    ")
+
         def parse_userip_ini_file(ini_path: Path, unresolved_ip_invalid: set[str]):
             def process_ini_line_output(line: str):
                 return line.strip()
@@ -2736,47 +2861,43 @@ def rendering_core():
                     continue
 
                 elif current_section == "Settings":
-                    match = RE_SETTINGS_INI_PARSER_PATTERN.search(line)
+                    match = RE_SETTINGS_INI_PARSER_PATTERN.match(line)
                     if not match:
                         # If it's a newline or a comment we don't really care about rewritting at this point.
                         if not line.startswith((";", "#")) or line == "":
-                            corrected_ini_data_lines = corrected_ini_data_lines[:-1]
+                            corrected_ini_data_lines.pop()
                         continue
 
                     setting = match.group("key")
                     if setting is None:
                         if corrected_ini_data_lines:
-                            corrected_ini_data_lines = corrected_ini_data_lines[:-1]
+                            corrected_ini_data_lines.pop()
                         continue
-                    if not isinstance(setting, str):
-                        raise TypeError(f'Expected "str" object, got "{type(setting).__name__}"')
                     value = match.group("value")
                     if value is None:
                         if corrected_ini_data_lines:
-                            corrected_ini_data_lines = corrected_ini_data_lines[:-1]
+                            corrected_ini_data_lines.pop()
                         continue
-                    if not isinstance(value, str):
-                        raise TypeError(f'Expected "str" object, got "{type(value).__name__}"')
 
                     setting = setting.strip()
                     if not setting:
                         if corrected_ini_data_lines:
-                            corrected_ini_data_lines = corrected_ini_data_lines[:-1]
+                            corrected_ini_data_lines.pop()
                         continue
                     value = value.strip()
                     if not value:
                         if corrected_ini_data_lines:
-                            corrected_ini_data_lines = corrected_ini_data_lines[:-1]
+                            corrected_ini_data_lines.pop()
                         continue
 
                     if not setting in USERIP_INI_SETTINGS:
                         if corrected_ini_data_lines:
-                            corrected_ini_data_lines = corrected_ini_data_lines[:-1]
+                            corrected_ini_data_lines.pop()
                         continue
 
                     if setting in settings:
                         if corrected_ini_data_lines:
-                            corrected_ini_data_lines = corrected_ini_data_lines[:-1]
+                            corrected_ini_data_lines.pop()
                         continue
                     else:
                         matched_settings.append(setting)
@@ -2865,21 +2986,7 @@ def rendering_core():
                             if not ini_path in UserIP_Databases.notified_settings_corrupted:
                                 UserIP_Databases.notified_settings_corrupted.add(ini_path)
                                 msgbox_title = TITLE
-                                msgbox_message = textwrap.indent(textwrap.dedent(f"""
-                                    ERROR:
-                                        Corrupted UserIP Database File (Settings)
-
-                                    INFOS:
-                                        UserIP database file:
-                                        \"{ini_path}\"
-                                        has an invalid settings value:
-
-                                        {setting}={value}
-
-                                        For more information on formatting, please refer to the
-                                        documentation:
-                                        https://github.com/BUZZARDGTA/Session-Sniffer?tab=readme-ov-file#userip_ini_databases_tutorial
-                                """.removeprefix("\n").removesuffix("\n")), "    ")
+                                msgbox_message = USERIP_CORRUPTED_SETTING_MSGBOX_TEMPLATE.format(ini_path=ini_path, setting=setting, value=value)
                                 msgbox_style = MsgBox.Style.OKOnly | MsgBox.Style.Exclamation | MsgBox.Style.MsgBoxSetForeground
                                 threading.Thread(target=MsgBox.show, args=(msgbox_title, msgbox_message, msgbox_style), daemon=True).start()
                             return None, None
@@ -2888,19 +2995,15 @@ def rendering_core():
                             corrected_ini_data_lines[-1] = f"{setting}={settings[setting]}"
 
                 elif current_section == "UserIP":
-                    match = RE_USERIP_INI_PARSER_PATTERN.search(line)
+                    match = RE_USERIP_INI_PARSER_PATTERN.match(line)
                     if not match:
                         continue
                     username = match.group("username")
                     if username is None:
                         continue
-                    if not isinstance(username, str):
-                        raise TypeError(f'Expected "str" object, got "{type(username).__name__}"')
                     ip = match.group("ip")
                     if ip is None:
                         continue
-                    if not isinstance(ip, str):
-                        raise TypeError(f'Expected "str" object, got "{type(ip).__name__}"')
 
                     username = username.strip()
                     if not username:
@@ -2910,23 +3013,14 @@ def rendering_core():
                         continue
 
                     if not is_ipv4_address(ip):
-                        unresolved_ip_invalid.add(f"{ini_path}={username}={ip}")
-                        if not f"{ini_path}={username}={ip}" in UserIP_Databases.notified_ip_invalid:
+                        invalid_ip_entry = f"{ini_path}={username}={ip}"
+                        unresolved_ip_invalid.add(invalid_ip_entry)
+                        if not invalid_ip_entry in UserIP_Databases.notified_ip_invalid:
                             msgbox_title = TITLE
-                            msgbox_message = textwrap.indent(textwrap.dedent(f"""
-                                ERROR:
-                                    UserIP databases invalid IP address
-
-                                INFOS:
-                                    The IP address from an entry is invalid (not an IP address).
-
-                                DEBUG:
-                                    \"{ini_path}\":
-                                    {username}={ip}
-                            """.removeprefix("\n").removesuffix("\n")), "    ")
+                            msgbox_message = USERIP_INVALID_IP_MSGBOX_TEMPLATE.format(ini_path=ini_path, username=username, ip=ip)
                             msgbox_style = MsgBox.Style.OKOnly | MsgBox.Style.Exclamation | MsgBox.Style.SystemModal | MsgBox.Style.MsgBoxSetForeground
                             threading.Thread(target=MsgBox.show, args=(msgbox_title, msgbox_message, msgbox_style), daemon=True).start()
-                            UserIP_Databases.notified_ip_invalid.add(f"{ini_path}={username}={ip}")
+                            UserIP_Databases.notified_ip_invalid.add(invalid_ip_entry)
                         continue
 
                     if username in userip:
@@ -2986,6 +3080,8 @@ def rendering_core():
             ), userip
 
         def update_userip_databases(last_userip_parse_time: Optional[float]):
+            nonlocal userip_databases_files_signature
+
             from Modules.constants.standard import USERIP_DATABASES_PATH
 
             DEFAULT_USERIP_FILE_HEADER = textwrap.dedent(f"""
@@ -3078,19 +3174,55 @@ def rendering_core():
             # TODO:
             # I should also warn again on another error, but it'd probably require a DICT then.
             # I have things more important to code atm.
-            for file_path in set(UserIP_Databases.notified_settings_corrupted):
-                if not file_path.is_file():
-                    UserIP_Databases.notified_settings_corrupted.remove(file_path)
+            UserIP_Databases.notified_settings_corrupted.difference_update([
+                file_path for file_path in UserIP_Databases.notified_settings_corrupted
+                if not file_path.is_file()
+            ])
+
+            userip_files_stats: dict[Path, tuple[int, int]] = {}
+            for userip_path in USERIP_DATABASES_PATH.rglob("*.ini"):
+                try:
+                    userip_path_stat = userip_path.stat()
+                except FileNotFoundError:
+                    continue
+                userip_files_stats[userip_path] = (userip_path_stat.st_size, userip_path_stat.st_mtime_ns)
+
+            # Skip the whole parsing and rebuilding when none of the UserIP files changed on disk
+            current_files_signature = frozenset(userip_files_stats.items())
+            if current_files_signature == userip_databases_files_signature:
+                return time.monotonic()
+
+            # Forget cached results of deleted files
+            for cached_path in userip_files_parse_cache.keys() - userip_files_stats.keys():
+                del userip_files_parse_cache[cached_path]
 
             new_databases: list[tuple[Path, UserIP_Settings, dict[str, list[str]]]] = []
             unresolved_ip_invalid: set[str] = set()
 
-            for userip_path in USERIP_DATABASES_PATH.rglob("*.ini"):
-                parsed_settings, parsed_data = parse_userip_ini_file(userip_path, unresolved_ip_invalid)
+            for userip_path, userip_path_stat in userip_files_stats.items():
+                cached_parse = userip_files_parse_cache.get(userip_path)
+                if cached_parse is not None and cached_parse[0] == userip_path_stat:
+                    _, parsed_settings, parsed_data, file_ip_invalid = cached_parse
+                else:
+                    file_ip_invalid: set[str] = set()
+                    parsed_settings, parsed_data = parse_userip_ini_file(userip_path, file_ip_invalid)
+
+                    # The parser may have rewritten the file, so cache it against its latest stats
+                    try:
+                        userip_path_stat_after_parse = userip_path.stat()
+                    except FileNotFoundError:
+                        pass
+                    else:
+                        userip_files_parse_cache[userip_path] = ((userip_path_stat_after_parse.st_size, userip_path_stat_after_parse.st_mtime_ns), parsed_settings, parsed_data, file_ip_invalid)
+                        userip_files_stats[userip_path] = (userip_path_stat_after_parse.st_size, userip_path_stat_after_parse.st_mtime_ns)
+
+                unresolved_ip_invalid.update(file_ip_invalid)
                 if parsed_settings is None or parsed_data is None:
                     continue
                 new_databases.append((userip_path, parsed_settings, parsed_data))
 
+            userip_databases_files_signature = frozenset(userip_files_stats.items())
+
             UserIP_Databases.populate(new_databases)
 
             resolved_ip_invalids = UserIP_Databases.notified_ip_invalid - unresolved_ip_invalid
@@ -3102,22 +3234,10 @@ def rendering_core():
             last_userip_parse_time = time.monotonic()
             return last_userip_parse_time
 
-        def get_country_info(ip_address: str):
+        def get_country_and_city_info(ip_address: str):
+            """Retrieve the country name, country code and city from a single GeoLite2 City lookup, as its response also carries the country."""
             country_name = "N/A"
             country_code = "N/A"
-
-            if geoip2_enabled:
-                try:
-                    response = geolite2_country_reader.country(ip_address)
-                except geoip2.errors.AddressNotFoundError:
-                    pass
-                else:
-                    country_name = str(response.country.name)
-                    country_code = str(response.country.iso_code)
-
-            return country_name, country_code
-
-        def get_city_info(ip_address: str):
             city = "N/A"
 
             if geoip2_enabled:
@@ -3126,9 +3246,11 @@ def rendering_core():
                 except geoip2.errors.AddressNotFoundError:
                     pass
                 else:
+                    country_name = str(response.country.name)
+                    country_code = str(response.country.iso_code)
                     city = str(response.city.name)
 
-            return city
+            return country_name, country_code, city
 
         def get_asn_info(ip_address: str):
             asn = "N/A"
@@ -3143,18 +3265,23 @@ def rendering_core():
 
             return asn
 
-        def get_minimum_padding(var: Union[str, float, int, bool], max_padding: int, padding: int):
-            current_padding = len(str(var))
+        def get_minimum_padding(values: list[Union[str, float, int, bool]], padding: int):
+            """Returns the length of the longest value that still fits within `padding`, or 0."""
+            return max((current_padding for current_padding in map(len, map(str, values)) if current_padding <= padding), default=0)
 
-            if current_padding <= padding:
-                if current_padding > max_padding:
-                    max_padding = current_padding
+        def process_session_logging():
+            nonlocal logging_datetimes_format_cache, last_session_logging_text
 
-            return max_padding
+            # Only the datetimes still displayed are carried over, so the cache doesn't grow with every `last_seen` update
+            next_logging_datetimes_format_cache: dict[datetime, str] = {}
 
-        def process_session_logging():
             def format_player_logging_datetime(datetime_object: datetime):
-                return datetime_object.strftime('%m/%d/%Y %H:%M:%S.%f')[:-3]
+                # `first_seen` and `last_rejoin` rarely change between two log writes, so reuse their previous formatting
+                formatted_datetime = logging_datetimes_format_cache.get(datetime_object)
+                if formatted_datetime is None:
+                    formatted_datetime = f"{datetime_object.month:02}/{datetime_object.day:02}/{datetime_object.year:04} {datetime_object.hour:02}:{datetime_object.minute:02}:{datetime_object.second:02}.{datetime_object.microsecond // 1000:03}"
+                next_logging_datetimes_format_cache[datetime_object] = formatted_datetime
+                return formatted_datetime
 
             def format_player_logging_usernames(player_usernames: list[str]):
                 return ", ".join(player_usernames) if player_usernames else "N/A"
@@ -3165,18 +3292,41 @@ def rendering_core():
                 return player_ip
 
             def format_player_logging_intermediate_ports(player_ports: Player_Ports):
-                player_ports.intermediate = [port for port in reversed(player_ports.list) if port not in {player_ports.first, player_ports.last}]
+                first_port, last_port = player_ports.first, player_ports.last
+                player_ports.intermediate = [port for port in reversed(player_ports.list) if port != first_port and port != last_port]
                 if player_ports.intermediate:
                     return ", ".join(map(str, player_ports.intermediate))
                 else:
                     return ""
 
-            def add_sort_arrow_char_to_sorted_logging_table_field(field_names: list[str], sorted_field: str, sort_order: Qt.SortOrder):
-                arrow = " \u2193" if sort_order == Qt.SortOrder.DescendingOrder else " \u2191"  # Down arrow for descending, up arrow for ascending
-                return [
-                    field + arrow if field == sorted_field else field
-                    for field in field_names
-                ]
+            def render_logging_table(table_name: str, title: str, field_names: tuple[str, ...], rows: list[list[str]]):
+                # PrettyTable measures every cell when rendering, so a table identical to its previous render (e.g. no one left meanwhile) reuses it
+                render_key = (title, field_names, rows)
+                cached_render = logging_tables_render_cache.get(table_name)
+                if cached_render is not None and cached_render[0] == render_key:
+                    return cached_render[1]
+
+                table = PrettyTable()
+                table.set_style(TableStyle.SINGLE_BORDER)
+                table.title = title
+                table.field_names = field_names
+                table.align = "l"
+                table.add_rows(rows)
+                rendered_table = table.get_string()
+
+                logging_tables_render_cache[table_name] = (render_key, rendered_table)
+                return rendered_table
+
+            def add_sort_arrow_char_to_sorted_logging_table_field(field_names: tuple[str, ...], sorted_field: str, sort_order: Qt.SortOrder):
+                # The field names only change along with the sorted column, so reuse the previously computed ones
+                cache_key = (field_names, sorted_field, sort_order)
+                if cache_key not in logging_field_names_with_sort_arrow_cache:
+                    arrow = " \u2193" if sort_order == Qt.SortOrder.DescendingOrder else " \u2191"  # Down arrow for descending, up arrow for ascending
+                    logging_field_names_with_sort_arrow_cache[cache_key] = tuple(
+                        field + arrow if field == sorted_field else field
+                        for field in field_names
+                    )
+                return logging_field_names_with_sort_arrow_cache[cache_key]
 
             # TODO:
             # When I have copilot again, ask it how can I manage to remove VSCode type hinting:
@@ -3186,140 +3336,177 @@ def rendering_core():
             logging_connected_players__field_names__with_down_arrow = add_sort_arrow_char_to_sorted_logging_table_field(LOGGING_CONNECTED_PLAYERS_TABLE__FIELD_NAMES, GUIrenderingData.session_connected_sorted_column_name, GUIrenderingData.session_connected_sort_order)
             logging_disconnected_players__field_names__with_down_arrow = add_sort_arrow_char_to_sorted_logging_table_field(LOGGING_DISCONNECTED_PLAYERS_TABLE__FIELD_NAMES, GUIrenderingData.session_disconnected_sorted_column_name, GUIrenderingData.session_disconnected_sort_order)
 
-            logging_connected_players_table = PrettyTable()
-            logging_connected_players_table.set_style(TableStyle.SINGLE_BORDER)
-            logging_connected_players_table.title = f"Player{pluralize(len(session_connected_sorted))} connected in your session ({len(session_connected_sorted)}):"
-            logging_connected_players_table.field_names = logging_connected_players__field_names__with_down_arrow
-            logging_connected_players_table.align = "l"
+            session_connected__padding_country_name = get_minimum_padding([player.iplookup.geolite2.country for player in session_connected_sorted], 27)
+            session_connected__padding_continent_name = get_minimum_padding([player.iplookup.ipapi.continent for player in session_connected_sorted], 13)
+            session_disconnected__padding_country_name = get_minimum_padding([player.iplookup.geolite2.country for player in session_disconnected_sorted], 27)
+            session_disconnected__padding_continent_name = get_minimum_padding([player.iplookup.ipapi.continent for player in session_disconnected_sorted], 13)
+
+            logging_connected_players_table__rows: list[list[str]] = []
             for player in session_connected_sorted:
-                row_texts: list[str] = []
-                row_texts.append(f"{format_player_logging_usernames(player.usernames)}")
-                row_texts.append(f"{format_player_logging_datetime(player.datetime.first_seen)}")
-                row_texts.append(f"{format_player_logging_datetime(player.datetime.last_rejoin)}")
-                row_texts.append(f"{player.rejoins}")
-                row_texts.append(f"{player.total_packets}")
-                row_texts.append(f"{player.packets}")
-                row_texts.append(f"{player.pps.rate}")
-                row_texts.append(f"{player.pps.get_average()}")
-                row_texts.append(f"{player.ppm.rate}")
-                row_texts.append(f"{player.ppm.get_average()}")
-                row_texts.append(f"{format_player_logging_ip(player.ip)}")
-                row_texts.append(f"{player.reverse_dns.hostname}")
-                row_texts.append(f"{player.ports.last}")
-                row_texts.append(f"{format_player_logging_intermediate_ports(player.ports)}")
-                row_texts.append(f"{player.ports.first}")
-                row_texts.append(f"{player.iplookup.ipapi.continent:<{session_connected__padding_continent_name}} ({player.iplookup.ipapi.continent_code})")
-                row_texts.append(f"{player.iplookup.geolite2.country:<{session_connected__padding_country_name}} ({player.iplookup.geolite2.country_code})")
-                row_texts.append(f"{player.iplookup.ipapi.region}")
-                row_texts.append(f"{player.iplookup.ipapi.region_code}")
-                row_texts.append(f"{player.iplookup.geolite2.city}")
-                row_texts.append(f"{player.iplookup.ipapi.district}")
-                row_texts.append(f"{player.iplookup.ipapi.zip_code}")
-                row_texts.append(f"{player.iplookup.ipapi.lat}")
-                row_texts.append(f"{player.iplookup.ipapi.lon}")
-                row_texts.append(f"{player.iplookup.ipapi.time_zone}")
-                row_texts.append(f"{player.iplookup.ipapi.offset}")
-                row_texts.append(f"{player.iplookup.ipapi.currency}")
-                row_texts.append(f"{player.iplookup.ipapi.org}")
-                row_texts.append(f"{player.iplookup.ipapi.isp}")
-                row_texts.append(f"{player.iplookup.geolite2.asn}")
-                row_texts.append(f"{player.iplookup.ipapi._as}")
-                row_texts.append(f"{player.iplookup.ipapi.as_name}")
-                row_texts.append(f"{player.iplookup.ipapi.mobile}")
-                row_texts.append(f"{player.iplookup.ipapi.proxy}")
-                row_texts.append(f"{player.iplookup.ipapi.hosting}")
-                row_texts.append(f"{player.ping.is_pinging}")
-                logging_connected_players_table.add_row(row_texts)
-
-            logging_disconnected_players_table = PrettyTable()
-            logging_disconnected_players_table.set_style(TableStyle.SINGLE_BORDER)
-            logging_disconnected_players_table.title = f"Player{pluralize(len(session_disconnected_sorted))} who've left your session ({len(session_disconnected_sorted)}):"
-            logging_disconnected_players_table.field_names = logging_disconnected_players__field_names__with_down_arrow
-            logging_disconnected_players_table.align = "l"
+                # Bind the nested objects once, rather than resolving their attribute chains for every cell
+                player_datetime = player.datetime
+                player_ports = player.ports
+                player_ipapi = player.iplookup.ipapi
+                player_geolite2 = player.iplookup.geolite2
+
+                logging_connected_players_table__rows.append([
+                    f"{format_player_logging_usernames(player.usernames)}",
+                    f"{format_player_logging_datetime(player_datetime.first_seen)}",
+                    f"{format_player_logging_datetime(player_datetime.last_rejoin)}",
+                    f"{player.rejoins}",
+                    f"{player.total_packets}",
+                    f"{player.packets}",
+                    f"{player.pps.rate}",
+                    f"{player.pps.get_average()}",
+                    f"{player.ppm.rate}",
+                    f"{player.ppm.get_average()}",
+                    f"{format_player_logging_ip(player.ip)}",
+                    f"{player.reverse_dns.hostname}",
+                    f"{player_ports.last}",
+                    f"{format_player_logging_intermediate_ports(player_ports)}",
+                    f"{player_ports.first}",
+                    f"{player_ipapi.continent:<{session_connected__padding_continent_name}} ({player_ipapi.continent_code})",
+                    f"{player_geolite2.country:<{session_connected__padding_country_name}} ({player_geolite2.country_code})",
+                    f"{player_ipapi.region}",
+                    f"{player_ipapi.region_code}",
+                    f"{player_geolite2.city}",
+                    f"{player_ipapi.district}",
+                    f"{player_ipapi.zip_code}",
+                    f"{player_ipapi.lat}",
+                    f"{player_ipapi.lon}",
+                    f"{player_ipapi.time_zone}",
+                    f"{player_ipapi.offset}",
+                    f"{player_ipapi.currency}",
+                    f"{player_ipapi.org}",
+                    f"{player_ipapi.isp}",
+                    f"{player_geolite2.asn}",
+                    f"{player_ipapi._as}",
+                    f"{player_ipapi.as_name}",
+                    f"{player_ipapi.mobile}",
+                    f"{player_ipapi.proxy}",
+                    f"{player_ipapi.hosting}",
+                    f"{player.ping.is_pinging}"
+                ])
+
+            logging_disconnected_players_table__rows: list[list[str]] = []
             for player in session_disconnected_sorted:
-                row_texts: list[str] = []
-                row_texts.append(f"{format_player_logging_usernames(player.usernames)}")
-                row_texts.append(f"{format_player_logging_datetime(player.datetime.first_seen)}")
-                row_texts.append(f"{format_player_logging_datetime(player.datetime.last_rejoin)}")
-                row_texts.append(f"{format_player_logging_datetime(player.datetime.last_seen)}")
-                row_texts.append(f"{player.rejoins}")
-                row_texts.append(f"{player.total_packets}")
-                row_texts.append(f"{player.packets}")
-                row_texts.append(f"{player.ip}")
-                row_texts.append(f"{player.reverse_dns.hostname}")
-                row_texts.append(f"{player.ports.last}")
-                row_texts.append(f"{format_player_logging_intermediate_ports(player.ports)}")
-                row_texts.append(f"{player.ports.first}")
-                row_texts.append(f"{player.iplookup.ipapi.continent:<{session_disconnected__padding_continent_name}} ({player.iplookup.ipapi.continent_code})")
-                row_texts.append(f"{player.iplookup.geolite2.country:<{session_disconnected__padding_country_name}} ({player.iplookup.geolite2.country_code})")
-                row_texts.append(f"{player.iplookup.ipapi.region}")
-                row_texts.append(f"{player.iplookup.ipapi.region_code}")
-                row_texts.append(f"{player.iplookup.geolite2.city}")
-                row_texts.append(f"{player.iplookup.ipapi.district}")
-                row_texts.append(f"{player.iplookup.ipapi.zip_code}")
-                row_texts.append(f"{player.iplookup.ipapi.lat}")
-                row_texts.append(f"{player.iplookup.ipapi.lon}")
-                row_texts.append(f"{player.iplookup.ipapi.time_zone}")
-                row_texts.append(f"{player.iplookup.ipapi.offset}")
-                row_texts.append(f"{player.iplookup.ipapi.currency}")
-                row_texts.append(f"{player.iplookup.ipapi.org}")
-                row_texts.append(f"{player.iplookup.ipapi.isp}")
-                row_texts.append(f"{player.iplookup.geolite2.asn}")
-                row_texts.append(f"{player.iplookup.ipapi._as}")
-                row_texts.append(f"{player.iplookup.ipapi.as_name}")
-                row_texts.append(f"{player.iplookup.ipapi.mobile}")
-                row_texts.append(f"{player.iplookup.ipapi.proxy}")
-                row_texts.append(f"{player.iplookup.ipapi.hosting}")
-                row_texts.append(f"{player.ping.is_pinging}")
-                logging_disconnected_players_table.add_row(row_texts)
+                # Bind the nested objects once, rather than resolving their attribute chains for every cell
+                player_datetime = player.datetime
+                player_ports = player.ports
+                player_ipapi = player.iplookup.ipapi
+                player_geolite2 = player.iplookup.geolite2
+
+                logging_disconnected_players_table__rows.append([
+                    f"{format_player_logging_usernames(player.usernames)}",
+                    f"{format_player_logging_datetime(player_datetime.first_seen)}",
+                    f"{format_player_logging_datetime(player_datetime.last_rejoin)}",
+                    f"{format_player_logging_datetime(player_datetime.last_seen)}",
+                    f"{player.rejoins}",
+                    f"{player.total_packets}",
+                    f"{player.packets}",
+                    f"{player.ip}",
+                    f"{player.reverse_dns.hostname}",
+                    f"{player_ports.last}",
+                    f"{format_player_logging_intermediate_ports(player_ports)}",
+                    f"{player_ports.first}",
+                    f"{player_ipapi.continent:<{session_disconnected__padding_continent_name}} ({player_ipapi.continent_code})",
+                    f"{player_geolite2.country:<{session_disconnected__padding_country_name}} ({player_geolite2.country_code})",
+                    f"{player_ipapi.region}",
+                    f"{player_ipapi.region_code}",
+                    f"{player_geolite2.city}",
+                    f"{player_ipapi.district}",
+                    f"{player_ipapi.zip_code}",
+                    f"{player_ipapi.lat}",
+                    f"{player_ipapi.lon}",
+                    f"{player_ipapi.time_zone}",
+                    f"{player_ipapi.offset}",
+                    f"{player_ipapi.currency}",
+                    f"{player_ipapi.org}",
+                    f"{player_ipapi.isp}",
+                    f"{player_geolite2.asn}",
+                    f"{player_ipapi._as}",
+                    f"{player_ipapi.as_name}",
+                    f"{player_ipapi.mobile}",
+                    f"{player_ipapi.proxy}",
+                    f"{player_ipapi.hosting}",
+                    f"{player.ping.is_pinging}"
+                ])
+
+            logging_connected_players_table = render_logging_table(
+                "connected",
+                f"Player{pluralize(len(session_connected_sorted))} connected in your session ({len(session_connected_sorted)}):",
+                logging_connected_players__field_names__with_down_arrow,
+                logging_connected_players_table__rows
+            )
+            logging_disconnected_players_table = render_logging_table(
+                "disconnected",
+                f"Player{pluralize(len(session_disconnected_sorted))} who've left your session ({len(session_disconnected_sorted)}):",
+                logging_disconnected_players__field_names__with_down_arrow,
+                logging_disconnected_players_table__rows
+            )
 
-            from Modules.constants.standard import SESSIONS_LOGGING_PATH
+            logging_datetimes_format_cache = next_logging_datetimes_format_cache
+
+            session_logging_text = logging_connected_players_table + "\n" + logging_disconnected_players_table
+            # Nothing to write if the tables are identical to the last write
+            if session_logging_text == last_session_logging_text:
+                return
 
-            # Check if the directories exist, if not create them
-            if not SESSIONS_LOGGING_PATH.parent.is_dir():
-                SESSIONS_LOGGING_PATH.parent.mkdir(parents=True)  # Create the directories if they don't exist
+            from Modules.constants.standard import SESSIONS_LOGGING_PATH
 
-            # Check if the file exists, if not create it
-            if not SESSIONS_LOGGING_PATH.is_file():
-                SESSIONS_LOGGING_PATH.touch()  # Create the file if it doesn't exist
+            if last_session_logging_text is None:
+                # Create the directories once, `write_text()` then creates or overwrites the file itself
+                SESSIONS_LOGGING_PATH.parent.mkdir(parents=True, exist_ok=True)
 
-            SESSIONS_LOGGING_PATH.write_text(logging_connected_players_table.get_string() + "\n" + logging_disconnected_players_table.get_string(), encoding="utf-8")
+            SESSIONS_LOGGING_PATH.write_text(session_logging_text, encoding="utf-8")
+            last_session_logging_text = session_logging_text
 
         def process_gui_session_tables_rendering():
+            nonlocal gui_datetimes_format_cache
+
+            # Only the datetimes still displayed are carried over, so the cache doesn't grow with every `last_seen` update
+            next_gui_datetimes_format_cache: dict[tuple[datetime, bool, bool], str] = {}
+
             def format_player_gui_datetime(datetime_object: datetime):
                 formatted_elapsed = None
 
-                if Settings.GUI_DATE_FIELDS_SHOW_ELAPSED:
-                    elapsed_time = datetime.now() - datetime_object
+                if show_elapsed:
+                    # Integer milliseconds, so the split below is plain integer arithmetic (clamped, as a packet may be newer than the render time)
+                    elapsed_milliseconds = max((rendering_datetime - datetime_object) // ONE_MILLISECOND_TIMEDELTA, 0)
 
-                    hours, remainder = divmod(elapsed_time.total_seconds(), 3600)
-                    minutes, remainder = divmod(remainder, 60)
-                    seconds, milliseconds = divmod(remainder * 1000, 1000)
+                    hours, remainder = divmod(elapsed_milliseconds, 3_600_000)
+                    minutes, remainder = divmod(remainder, 60_000)
+                    seconds, milliseconds = divmod(remainder, 1000)
 
                     elapsed_parts: list[str] = []
-                    if hours >= 1:
-                        elapsed_parts.append(f"{int(hours):02}h")
-                    if elapsed_parts or minutes >= 1:
-                        elapsed_parts.append(f"{int(minutes):02}m")
-                    if elapsed_parts or seconds >= 1:
-                        elapsed_parts.append(f"{int(seconds):02}s")
-                    if not elapsed_parts and milliseconds > 0:
-                        elapsed_parts.append(f"{int(milliseconds):03}ms")
+                    if hours:
+                        elapsed_parts.append(f"{hours:02}h")
+                    if elapsed_parts or minutes:
+                        elapsed_parts.append(f"{minutes:02}m")
+                    if elapsed_parts or seconds:
+                        elapsed_parts.append(f"{seconds:02}s")
+                    if not elapsed_parts and milliseconds:
+                        elapsed_parts.append(f"{milliseconds:03}ms")
 
                     formatted_elapsed = " ".join(elapsed_parts)
 
-                    if Settings.GUI_DATE_FIELDS_SHOW_DATE is False and Settings.GUI_DATE_FIELDS_SHOW_TIME is False:
+                    if show_date is False and show_time is False:
                         return formatted_elapsed
 
-                parts: list[str] = []
-                if Settings.GUI_DATE_FIELDS_SHOW_DATE:
-                    parts.append(datetime_object.strftime("%m/%d/%Y"))
-                if Settings.GUI_DATE_FIELDS_SHOW_TIME:
-                    parts.append(datetime_object.strftime("%H:%M:%S.%f")[:-3])
-                if not parts:
-                    raise ValueError("Invalid settings: Both date and time are disabled.")
-
-                formatted_datetime = " ".join(parts)
+                # `first_seen` and `last_rejoin` rarely change between two renders, so reuse their previous formatting (the elapsed part stays live)
+                datetime_cache_key = (datetime_object, show_date, show_time)
+                formatted_datetime = gui_datetimes_format_cache.get(datetime_cache_key)
+                if formatted_datetime is None:
+                    parts: list[str] = []
+                    if show_date:
+                        parts.append(f"{datetime_object.month:02}/{datetime_object.day:02}/{datetime_object.year:04}")
+                    if show_time:
+                        parts.append(f"{datetime_object.hour:02}:{datetime_object.minute:02}:{datetime_object.second:02}.{datetime_object.microsecond // 1000:03}")
+                    if not parts:
+                        raise ValueError("Invalid settings: Both date and time are disabled.")
+
+                    formatted_datetime = " ".join(parts)
+                next_gui_datetimes_format_cache[datetime_cache_key] = formatted_datetime
 
                 if formatted_elapsed:
                     formatted_datetime += f" ({formatted_elapsed})"
@@ -3335,7 +3522,8 @@ def rendering_core():
                 return player_ip
 
             def format_player_gui_intermediate_ports(player_ports: Player_Ports):
-                player_ports.intermediate = [port for port in reversed(player_ports.list) if port not in {player_ports.first, player_ports.last}]
+                first_port, last_port = player_ports.first, player_ports.last
+                player_ports.intermediate = [port for port in reversed(player_ports.list) if port != first_port and port != last_port]
                 if player_ports.intermediate:
                     return ", ".join(map(str, player_ports.intermediate))
                 else:
@@ -3344,42 +3532,94 @@ def rendering_core():
             def get_player_gui_pps_color(pps_color: QColor, is_pps_first_calculation: bool, pps_rate: int):
                 if not is_pps_first_calculation:
                     if pps_rate == 0:
-                        pps_color = QColor("red")
+                        pps_color = QCOLOR_RED
                     elif pps_rate >= 1 and pps_rate <= 3:
-                        pps_color = QColor("yellow")
+                        pps_color = QCOLOR_YELLOW
 
                 return pps_color
 
             def get_player_gui_avg_pps_color(avg_pps_color: QColor, is_pps_first_calculation: bool, pps_rate: int):
                 if not is_pps_first_calculation:
                     if pps_rate == 0:
-                        avg_pps_color = QColor("red")
+                        avg_pps_color = QCOLOR_RED
                     elif pps_rate >= 1 and pps_rate <= 3:
-                        avg_pps_color = QColor("yellow")
+                        avg_pps_color = QCOLOR_YELLOW
 
                 return avg_pps_color
 
             def get_player_gui_ppm_color(ppm_color: QColor, is_ppm_first_calculation: bool, ppm_rate: int):
                 if not is_ppm_first_calculation:
                     if ppm_rate == 0:
-                        ppm_color = QColor("red")
+                        ppm_color = QCOLOR_RED
                     elif ppm_rate >= 1 and ppm_rate <= 3:
-                        ppm_color = QColor("yellow")
+                        ppm_color = QCOLOR_YELLOW
 
                 return ppm_color
 
             def get_player_gui_avg_ppm_color(avg_ppm_color: QColor, is_ppm_first_calculation: bool, ppm_rate: int):
                 if not is_ppm_first_calculation:
                     if ppm_rate == 0:
-                        avg_ppm_color = QColor("red")
+                        avg_ppm_color = QCOLOR_RED
                     elif ppm_rate >= 1 and ppm_rate <= 3:
-                        avg_ppm_color = QColor("yellow")
+                        avg_ppm_color = QCOLOR_YELLOW
 
                 return avg_ppm_color
 
 
             from Modules.constants.external import HARDCODED_DEFAULT_TABLE_BACKGROUD_CELL_COLOR
 
+            rendering_datetime = datetime.now()  # Reference time for all the elapsed durations of this render
+
+            # Settings read by every row, bound once per render instead of being looked up for each player
+            show_date = Settings.GUI_DATE_FIELDS_SHOW_DATE
+            show_time = Settings.GUI_DATE_FIELDS_SHOW_TIME
+            show_elapsed = Settings.GUI_DATE_FIELDS_SHOW_ELAPSED
+            pps_column_index = None if "PPS" in GUIrenderingData.FIELDS_TO_HIDE else CONNECTED_COLUMN_MAPPING["PPS"]
+            avg_pps_column_index = None if "Avg PPS" in GUIrenderingData.FIELDS_TO_HIDE else CONNECTED_COLUMN_MAPPING["Avg PPS"]
+            ppm_column_index = None if "PPM" in GUIrenderingData.FIELDS_TO_HIDE else CONNECTED_COLUMN_MAPPING["PPM"]
+            avg_ppm_column_index = None if "Avg PPM" in GUIrenderingData.FIELDS_TO_HIDE else CONNECTED_COLUMN_MAPPING["Avg PPM"]
+
+            # Getters of the optional trailing columns shared by both tables, in display order.
+            # Only the visible ones are kept, so that rows don't test `FIELDS_TO_HIDE` again for every player.
+            gui_optional_fields_getters = [
+                get_player_gui_field for field_name, get_player_gui_field in (
+                    ("Hostname", attrgetter("reverse_dns.hostname")),
+                    ("Last Port", attrgetter("ports.last")),
+                    ("Intermediate Ports", lambda player: format_player_gui_intermediate_ports(player.ports)),
+                    ("First Port", attrgetter("ports.first")),
+                    ("Continent", (
+                        (lambda player: f"{player.iplookup.ipapi.continent} ({player.iplookup.ipapi.continent_code})")
+                        if Settings.GUI_FIELD_SHOW_CONTINENT_CODE else
+                        attrgetter("iplookup.ipapi.continent")
+                    )),
+                    ("Country", (
+                        (lambda player: f"{player.iplookup.geolite2.country} ({player.iplookup.geolite2.country_code})")
+                        if Settings.GUI_FIELD_SHOW_COUNTRY_CODE else
+                        attrgetter("iplookup.geolite2.country")
+                    )),
+                    ("Region", attrgetter("iplookup.ipapi.region")),
+                    ("R. Code", attrgetter("iplookup.ipapi.region_code")),
+                    ("City", attrgetter("iplookup.geolite2.city")),
+                    ("District", attrgetter("iplookup.ipapi.district")),
+                    ("ZIP Code", attrgetter("iplookup.ipapi.zip_code")),
+                    ("Lat", attrgetter("iplookup.ipapi.lat")),
+                    ("Lon", attrgetter("iplookup.ipapi.lon")),
+                    ("Time Zone", attrgetter("iplookup.ipapi.time_zone")),
+                    ("Offset", attrgetter("iplookup.ipapi.offset")),
+                    ("Currency", attrgetter("iplookup.ipapi.currency")),
+                    ("Organization", attrgetter("iplookup.ipapi.org")),
+                    ("ISP", attrgetter("iplookup.ipapi.isp")),
+                    ("ASN / ISP", attrgetter("iplookup.geolite2.asn")),
+                    ("AS", attrgetter("iplookup.ipapi._as")),
+                    ("ASN", attrgetter("iplookup.ipapi.as_name")),
+                    ("Mobile", attrgetter("iplookup.ipapi.mobile")),
+                    ("VPN", attrgetter("iplookup.ipapi.proxy")),
+                    ("Hosting", attrgetter("iplookup.ipapi.hosting")),
+                    ("Pinging", attrgetter("ping.is_pinging"))
+                )
+                if field_name not in GUIrenderingData.FIELDS_TO_HIDE
+            ]
+
             session_connected_table__processed_data: list[list[str]] = []
             session_connected_table__compiled_colors: list[list[CellColor]] = []
             session_disconnected_table__processed_data: list[list[str]] = []
@@ -3387,17 +3627,14 @@ def rendering_core():
 
             for player in session_connected_sorted:
                 if player.userip.usernames:
-                    row_fg_color = QColor("white")
+                    row_fg_color = QCOLOR_WHITE
                     row_bg_color = player.userip.settings.COLOR
                 else:
-                    row_fg_color = QColor("lime")
+                    row_fg_color = QCOLOR_LIME
                     row_bg_color = HARDCODED_DEFAULT_TABLE_BACKGROUD_CELL_COLOR
 
-                # Initialize a list for cell colors for the current row, creating a new CellColor object for each column
-                row_colors = [
-                    CellColor(foreground=row_fg_color, background=row_bg_color)
-                    for _ in range(GUIrenderingData.SESSION_CONNECTED_TABLE__NUM_COLS)
-                ]
+                # Initialize a list for cell colors for the current row, sharing a single (immutable) CellColor object across all columns
+                row_colors = [CellColor(foreground=row_fg_color, background=row_bg_color)] * GUIrenderingData.SESSION_CONNECTED_TABLE__NUM_COLS
 
                 row_texts: list[str] = []
                 row_texts.append(f"{format_player_gui_usernames(player.usernames)}")
@@ -3406,89 +3643,34 @@ def rendering_core():
                 row_texts.append(f"{player.rejoins}")
                 row_texts.append(f"{player.total_packets}")
                 row_texts.append(f"{player.packets}")
-                if "PPS" not in GUIrenderingData.FIELDS_TO_HIDE:
-                    row_colors[CONNECTED_COLUMN_MAPPING["PPS"]] = row_colors[CONNECTED_COLUMN_MAPPING["PPS"]]._replace(foreground=get_player_gui_pps_color(row_fg_color, player.pps.is_first_calculation, player.pps.rate)) # Update the foreground color for the "PPS" column
+                if pps_column_index is not None:
+                    row_colors[pps_column_index] = row_colors[pps_column_index]._replace(foreground=get_player_gui_pps_color(row_fg_color, player.pps.is_first_calculation, player.pps.rate)) # Update the foreground color for the "PPS" column
                     row_texts.append(f"{player.pps.rate}")
-                if "Avg PPS" not in GUIrenderingData.FIELDS_TO_HIDE:
-                    row_colors[CONNECTED_COLUMN_MAPPING["Avg PPS"]] = row_colors[CONNECTED_COLUMN_MAPPING["Avg PPS"]]._replace(foreground=get_player_gui_avg_pps_color(row_fg_color, player.pps.is_first_calculation, player.pps.rate)) # Update the foreground color for the "Avg PPS" column
+                if avg_pps_column_index is not None:
+                    row_colors[avg_pps_column_index] = row_colors[avg_pps_column_index]._replace(foreground=get_player_gui_avg_pps_color(row_fg_color, player.pps.is_first_calculation, player.pps.rate)) # Update the foreground color for the "Avg PPS" column
                     row_texts.append(f"{player.pps.get_average()}")
-                if "PPM" not in GUIrenderingData.FIELDS_TO_HIDE:
-                    row_colors[CONNECTED_COLUMN_MAPPING["PPM"]] = row_colors[CONNECTED_COLUMN_MAPPING["PPM"]]._replace(foreground=get_player_gui_ppm_color(row_fg_color, player.ppm.is_first_calculation, player.ppm.rate)) # Update the foreground color for the "PPM" column
+                if ppm_column_index is not None:
+                    row_colors[ppm_column_index] = row_colors[ppm_column_index]._replace(foreground=get_player_gui_ppm_color(row_fg_color, player.ppm.is_first_calculation, player.ppm.rate)) # Update the foreground color for the "PPM" column
                     row_texts.append(f"{player.ppm.rate}")
-                if "Avg PPM" not in GUIrenderingData.FIELDS_TO_HIDE:
-                    row_colors[CONNECTED_COLUMN_MAPPING["Avg PPM"]] = row_colors[CONNECTED_COLUMN_MAPPING["Avg PPM"]]._replace(foreground=get_player_gui_avg_ppm_color(row_fg_color, player.ppm.is_first_calculation, player.ppm.rate)) # Update the foreground color for the "Avg PPM" column
+                if avg_ppm_column_index is not None:
+                    row_colors[avg_ppm_column_index] = row_colors[avg_ppm_column_index]._replace(foreground=get_player_gui_avg_ppm_color(row_fg_color, player.ppm.is_first_calculation, player.ppm.rate)) # Update the foreground color for the "Avg PPM" column
                     row_texts.append(f"{player.ppm.get_average()}")
                 row_texts.append(f"{format_player_gui_ip(player.ip)}")
-                if "Hostname" not in GUIrenderingData.FIELDS_TO_HIDE:
-                    row_texts.append(f"{player.reverse_dns.hostname}")
-                if "Last Port" not in GUIrenderingData.FIELDS_TO_HIDE:
-                    row_texts.append(f"{player.ports.last}")
-                if "Intermediate Ports" not in GUIrenderingData.FIELDS_TO_HIDE:
-                    row_texts.append(f"{format_player_gui_intermediate_ports(player.ports)}")
-                if "First Port" not in GUIrenderingData.FIELDS_TO_HIDE:
-                    row_texts.append(f"{player.ports.first}")
-                if "Continent" not in GUIrenderingData.FIELDS_TO_HIDE:
-                    if Settings.GUI_FIELD_SHOW_CONTINENT_CODE:
-                        row_texts.append(f"{player.iplookup.ipapi.continent} ({player.iplookup.ipapi.continent_code})")
-                    else:
-                        row_texts.append(f"{player.iplookup.ipapi.continent}")
-                if "Country" not in GUIrenderingData.FIELDS_TO_HIDE:
-                    if Settings.GUI_FIELD_SHOW_COUNTRY_CODE:
-                        row_texts.append(f"{player.iplookup.geolite2.country} ({player.iplookup.geolite2.country_code})")
-                    else:
-                        row_texts.append(f"{player.iplookup.geolite2.country}")
-                if "Region" not in GUIrenderingData.FIELDS_TO_HIDE:
-                    row_texts.append(f"{player.iplookup.ipapi.region}")
-                if "R. Code" not in GUIrenderingData.FIELDS_TO_HIDE:
-                    row_texts.append(f"{player.iplookup.ipapi.region_code}")
-                if "City" not in GUIrenderingData.FIELDS_TO_HIDE:
-                    row_texts.append(f"{player.iplookup.geolite2.city}")
-                if "District" not in GUIrenderingData.FIELDS_TO_HIDE:
-                    row_texts.append(f"{player.iplookup.ipapi.district}")
-                if "ZIP Code" not in GUIrenderingData.FIELDS_TO_HIDE:
-                    row_texts.append(f"{player.iplookup.ipapi.zip_code}")
-                if "Lat" not in GUIrenderingData.FIELDS_TO_HIDE:
-                    row_texts.append(f"{player.iplookup.ipapi.lat}")
-                if "Lon" not in GUIrenderingData.FIELDS_TO_HIDE:
-                    row_texts.append(f"{player.iplookup.ipapi.lon}")
-                if "Time Zone" not in GUIrenderingData.FIELDS_TO_HIDE:
-                    row_texts.append(f"{player.iplookup.ipapi.time_zone}")
-                if "Offset" not in GUIrenderingData.FIELDS_TO_HIDE:
-                    row_texts.append(f"{player.iplookup.ipapi.offset}")
-                if "Currency" not in GUIrenderingData.FIELDS_TO_HIDE:
-                    row_texts.append(f"{player.iplookup.ipapi.currency}")
-                if "Organization" not in GUIrenderingData.FIELDS_TO_HIDE:
-                    row_texts.append(f"{player.iplookup.ipapi.org}")
-                if "ISP" not in GUIrenderingData.FIELDS_TO_HIDE:
-                    row_texts.append(f"{player.iplookup.ipapi.isp}")
-                if "ASN / ISP" not in GUIrenderingData.FIELDS_TO_HIDE:
-                    row_texts.append(f"{player.iplookup.geolite2.asn}")
-                if "AS" not in GUIrenderingData.FIELDS_TO_HIDE:
-                    row_texts.append(f"{player.iplookup.ipapi._as}")
-                if "ASN" not in GUIrenderingData.FIELDS_TO_HIDE:
-                    row_texts.append(f"{player.iplookup.ipapi.as_name}")
-                if "Mobile" not in GUIrenderingData.FIELDS_TO_HIDE:
-                    row_texts.append(f"{player.iplookup.ipapi.mobile}")
-                if "VPN" not in GUIrenderingData.FIELDS_TO_HIDE:
-                    row_texts.append(f"{player.iplookup.ipapi.proxy}")
-                if "Hosting" not in GUIrenderingData.FIELDS_TO_HIDE:
-                    row_texts.append(f"{player.iplookup.ipapi.hosting}")
-                if "Pinging" not in GUIrenderingData.FIELDS_TO_HIDE:
-                    row_texts.append(f"{player.ping.is_pinging}")
+                row_texts.extend([f"{get_player_gui_field(player)}" for get_player_gui_field in gui_optional_fields_getters])
 
                 session_connected_table__processed_data.append(row_texts)
                 session_connected_table__compiled_colors.append(row_colors)
 
             for player in session_disconnected_sorted:
                 if player.userip.usernames:
-                    row_fg_color = QColor("white")
+                    row_fg_color = QCOLOR_WHITE
                     row_bg_color = player.userip.settings.COLOR
                 else:
-                    row_fg_color = QColor("red")
+                    row_fg_color = QCOLOR_RED
                     row_bg_color = HARDCODED_DEFAULT_TABLE_BACKGROUD_CELL_COLOR
 
-                # Initialize a list for cell colors for the current row, creating a new CellColor object for each column
-                row_colors = [CellColor(foreground=row_fg_color, background=row_bg_color) for _ in range(GUIrenderingData.SESSION_DISCONNECTED_TABLE__NUM_COLS)]
+                # Initialize a list for cell colors for the current row, sharing a single (immutable) CellColor object across all columns
+                row_colors = [CellColor(foreground=row_fg_color, background=row_bg_color)] * GUIrenderingData.SESSION_DISCONNECTED_TABLE__NUM_COLS
 
                 row_texts: list[str] = []
                 row_texts.append(f"{format_player_gui_usernames(player.usernames)}")
@@ -3499,66 +3681,13 @@ def rendering_core():
                 row_texts.append(f"{player.total_packets}")
                 row_texts.append(f"{player.packets}")
                 row_texts.append(f"{player.ip}")
-                if "Hostname" not in GUIrenderingData.FIELDS_TO_HIDE:
-                    row_texts.append(f"{player.reverse_dns.hostname}")
-                if "Last Port" not in GUIrenderingData.FIELDS_TO_HIDE:
-                    row_texts.append(f"{player.ports.last}")
-                if "Intermediate Ports" not in GUIrenderingData.FIELDS_TO_HIDE:
-                    row_texts.append(f"{format_player_gui_intermediate_ports(player.ports)}")
-                if "First Port" not in GUIrenderingData.FIELDS_TO_HIDE:
-                    row_texts.append(f"{player.ports.first}")
-                if "Continent" not in GUIrenderingData.FIELDS_TO_HIDE:
-                    if Settings.GUI_FIELD_SHOW_CONTINENT_CODE:
-                        row_texts.append(f"{player.iplookup.ipapi.continent} ({player.iplookup.ipapi.continent_code})")
-                    else:
-                        row_texts.append(f"{player.iplookup.ipapi.continent}")
-                if "Country" not in GUIrenderingData.FIELDS_TO_HIDE:
-                    if Settings.GUI_FIELD_SHOW_COUNTRY_CODE:
-                        row_texts.append(f"{player.iplookup.geolite2.country} ({player.iplookup.geolite2.country_code})")
-                    else:
-                        row_texts.append(f"{player.iplookup.geolite2.country}")
-                if "Region" not in GUIrenderingData.FIELDS_TO_HIDE:
-                    row_texts.append(f"{player.iplookup.ipapi.region}")
-                if "R. Code" not in GUIrenderingData.FIELDS_TO_HIDE:
-                    row_texts.append(f"{player.iplookup.ipapi.region_code}")
-                if "City" not in GUIrenderingData.FIELDS_TO_HIDE:
-                    row_texts.append(f"{player.iplookup.geolite2.city}")
-                if "District" not in GUIrenderingData.FIELDS_TO_HIDE:
-                    row_texts.append(f"{player.iplookup.ipapi.district}")
-                if "ZIP Code" not in GUIrenderingData.FIELDS_TO_HIDE:
-                    row_texts.append(f"{player.iplookup.ipapi.zip_code}")
-                if "Lat" not in GUIrenderingData.FIELDS_TO_HIDE:
-                    row_texts.append(f"{player.iplookup.ipapi.lat}")
-                if "Lon" not in GUIrenderingData.FIELDS_TO_HIDE:
-                    row_texts.append(f"{player.iplookup.ipapi.lon}")
-                if "Time Zone" not in GUIrenderingData.FIELDS_TO_HIDE:
-                    row_texts.append(f"{player.iplookup.ipapi.time_zone}")
-                if "Offset" not in GUIrenderingData.FIELDS_TO_HIDE:
-                    row_texts.append(f"{player.iplookup.ipapi.offset}")
-                if "Currency" not in GUIrenderingData.FIELDS_TO_HIDE:
-                    row_texts.append(f"{player.iplookup.ipapi.currency}")
-                if "Organization" not in GUIrenderingData.FIELDS_TO_HIDE:
-                    row_texts.append(f"{player.iplookup.ipapi.org}")
-                if "ISP" not in GUIrenderingData.FIELDS_TO_HIDE:
-                    row_texts.append(f"{player.iplookup.ipapi.isp}")
-                if "ASN / ISP" not in GUIrenderingData.FIELDS_TO_HIDE:
-                    row_texts.append(f"{player.iplookup.geolite2.asn}")
-                if "AS" not in GUIrenderingData.FIELDS_TO_HIDE:
-                    row_texts.append(f"{player.iplookup.ipapi._as}")
-                if "ASN" not in GUIrenderingData.FIELDS_TO_HIDE:
-                    row_texts.append(f"{player.iplookup.ipapi.as_name}")
-                if "Mobile" not in GUIrenderingData.FIELDS_TO_HIDE:
-                    row_texts.append(f"{player.iplookup.ipapi.mobile}")
-                if "VPN" not in GUIrenderingData.FIELDS_TO_HIDE:
-                    row_texts.append(f"{player.iplookup.ipapi.proxy}")
-                if "Hosting" not in GUIrenderingData.FIELDS_TO_HIDE:
-                    row_texts.append(f"{player.iplookup.ipapi.hosting}")
-                if "Pinging" not in GUIrenderingData.FIELDS_TO_HIDE:
-                    row_texts.append(f"{player.ping.is_pinging}")
+                row_texts.extend([f"{get_player_gui_field(player)}" for get_player_gui_field in gui_optional_fields_getters])
 
                 session_disconnected_table__processed_data.append(row_texts)
                 session_disconnected_table__compiled_colors.append(row_colors)
 
+            gui_datetimes_format_cache = next_gui_datetimes_format_cache
+
             return (
                 len(session_connected_table__processed_data),
                 session_connected_table__processed_data,
@@ -3569,37 +3698,32 @@ def rendering_core():
             )
 
         def generate_gui_header_text(global_pps_last_update_time: float, global_pps_rate: int):
-            global global_pps_counter, tshark_packets_latencies
-
-            if capture.extracted_tshark_version == TSHARK_RECOMMENDED_VERSION_NUMBER:
-                tshark_version_color = '<span style="color: green;">'
-            else:
-                tshark_version_color = '<span style="color: yellow;">'
+            global global_pps_counter, tshark_packets_latencies_sum
+            nonlocal header_scanning_text_cache
 
-            one_second_ago = datetime.now() - timedelta(seconds=1)
+            one_second_ago = time.time() - 1.0
 
-            # Filter packets received in the last second
-            recent_packets = [(pkt_time, pkt_latency) for pkt_time, pkt_latency in tshark_packets_latencies if pkt_time >= one_second_ago]
+            with tshark_packets_latencies_lock:
+                # Drop packets older than one second, packets are appended in chronological order
+                while tshark_packets_latencies and tshark_packets_latencies[0][0] < one_second_ago:
+                    tshark_packets_latencies_sum -= tshark_packets_latencies.popleft()[1]
 
-            # Update latencies list to only keep recent packets
-            tshark_packets_latencies[:] = recent_packets
-
-            # Calculate average latency
-            if recent_packets:
-                total_latency_seconds = sum(pkt_latency.total_seconds() for _, pkt_latency in recent_packets)
-                avg_latency_seconds = total_latency_seconds / len(recent_packets)
-                avg_latency_rounded = round(avg_latency_seconds, 1)
-            else:
-                avg_latency_seconds = 0.0
-                avg_latency_rounded = 0.0
+                # Calculate average latency
+                if tshark_packets_latencies:
+                    avg_latency_seconds = tshark_packets_latencies_sum / len(tshark_packets_latencies)
+                    avg_latency_rounded = round(avg_latency_seconds, 1)
+                else:
+                    tshark_packets_latencies_sum = 0.0  # Resets accumulated floating-point drift
+                    avg_latency_seconds = 0.0
+                    avg_latency_rounded = 0.0
 
             # Determine latency color
-            if avg_latency_seconds >= 0.90 * Settings.CAPTURE_OVERFLOW_TIMER:
-                latency_color = '<span style="color: red;">'
-            elif avg_latency_seconds >= 0.75 * Settings.CAPTURE_OVERFLOW_TIMER:
-                latency_color = '<span style="color: yellow;">'
+            if avg_latency_seconds >= LATENCY_RED_THRESHOLD:
+                latency_color = HTML_SPAN_RED
+            elif avg_latency_seconds >= LATENCY_YELLOW_THRESHOLD:
+                latency_color = HTML_SPAN_YELLOW
             else:
-                latency_color = '<span style="color: green;">'
+                latency_color = HTML_SPAN_GREEN
 
             if (time.monotonic() - global_pps_last_update_time) >= 1.0:
                 global_pps_rate = global_pps_counter
@@ -3610,11 +3734,11 @@ def rendering_core():
             # If the packet rate exceeds these ranges, we flag them with yellow or red color to indicate potential issues (such as scanning unwanted packets outside of the GTA game).
             # Also these values averagely indicates the max performances my script can run at during my testings. Luckely it's just enough to process GTA V game.
             if global_pps_rate >= 3000:
-                pps_color = '<span style="color: red;">'
+                pps_color = HTML_SPAN_RED
             elif global_pps_rate >= 1500:
-                pps_color = '<span style="color: yellow;">'
+                pps_color = HTML_SPAN_YELLOW
             else:
-                pps_color = '<span style="color: green;">'
+                pps_color = HTML_SPAN_GREEN
 
             # NOTE: Hack for stupid VSCode type hinting
             if user_interface_selection is None:
@@ -3623,7 +3747,22 @@ def rendering_core():
             is_vpn_mode_enabled = "Enabled" if Settings.CAPTURE_VPN_MODE or force_enable_capture_vpn_mode else "Disabled"
             is_arp_enabled = "Enabled" if interfaces_selection_data[user_interface_selection].is_arp else "Disabled"
             displayed_capture_ip_address = Settings.CAPTURE_IP_ADDRESS if Settings.CAPTURE_IP_ADDRESS else "N/A"
-            color_tshark_restarted_time = '<span style="color: green;">' if tshark_restarted_times == 0 else '<span style="color: red;">'
+
+            # The scanning line only changes along with the capture settings, so it is rebuilt only when they do
+            header_scanning_text_key = (capture.extracted_tshark_version, capture.interface, displayed_capture_ip_address, is_arp_enabled, is_vpn_mode_enabled, Settings.CAPTURE_PROGRAM_PRESET)
+            if header_scanning_text_cache is None or header_scanning_text_cache[0] != header_scanning_text_key:
+                if capture.extracted_tshark_version == TSHARK_RECOMMENDED_VERSION_NUMBER:
+                    tshark_version_color = HTML_SPAN_GREEN
+                else:
+                    tshark_version_color = HTML_SPAN_YELLOW
+
+                header_scanning_text_cache = (
+                    header_scanning_text_key,
+                    f'Scanning with TShark {tshark_version_color}v{capture.extracted_tshark_version}</span> on Interface <span style="color: yellow;">{capture.interface}</span> | IP:<span style="color: yellow;">{displayed_capture_ip_address}</span> | ARP:<span style="color: yellow;">{is_arp_enabled}</span> | VPN:<span style="color: yellow;">{is_vpn_mode_enabled}</span> | Preset:<span style="color: yellow;">{Settings.CAPTURE_PROGRAM_PRESET}</span>'
+                )
+            header_scanning_text = header_scanning_text_cache[1]
+
+            color_tshark_restarted_time = HTML_SPAN_GREEN if tshark_restarted_times == 0 else HTML_SPAN_RED
             if Settings.DISCORD_PRESENCE:
                 rpc_message = f' RPC:<span style="color: green;">Connected</span>' if discord_rpc_manager.connection_status.is_set() else f' RPC:<span style="color: yellow;">Waiting for Discord</span>'
             else:
@@ -3634,38 +3773,83 @@ def rendering_core():
             conflict_ip_count = len(UserIP_Databases.notified_ip_conflicts)
             corrupted_settings_count = len(UserIP_Databases.notified_settings_corrupted)
 
-            header = f"""
-            <div style="background: linear-gradient(90deg, #2e3440, #4c566a); color: white; padding: 20px; border: 2px solid #88c0d0; border-radius: 8px; box-shadow: 0px 4px 10px rgba(0, 0, 0, 0.3);">
-                <div>
-                    <span style="font-size: 24px; color: #88c0d0">Welcome to {TITLE}</span>&nbsp;&nbsp;<span style="font-size: 14px; color: #aaa">{VERSION}</span>
-                </div>
-                <p style="font-size: 16px; margin: 5px 0;">
-                    The best FREE and Open-Source packet sniffer, aka IP grabber, works WITHOUT mods.
-                </p>
-                <p style="font-size: 14px; margin: 5px 0;">
-                    Scanning with TShark {tshark_version_color}v{capture.extracted_tshark_version}</span> on Interface <span style="color: yellow;">{capture.interface}</span> | IP:<span style="color: yellow;">{displayed_capture_ip_address}</span> | ARP:<span style="color: yellow;">{is_arp_enabled}</span> | VPN:<span style="color: yellow;">{is_vpn_mode_enabled}</span> | Preset:<span style="color: yellow;">{Settings.CAPTURE_PROGRAM_PRESET}</span>
-                </p>
-                <p style="font-size: 14px; margin: 5px 0;">
-                    Packets latency per sec:{latency_color}{avg_latency_rounded}</span>/<span style="color: green;">{Settings.CAPTURE_OVERFLOW_TIMER}</span> (tshark restart{pluralize(tshark_restarted_times)}:{color_tshark_restarted_time}{tshark_restarted_times}</span>) PPS:{pps_color}{global_pps_rate}</span>{rpc_message}
-                </p>
-            </div>
-            """
+            # Only swap the dynamic slots of the pre-tokenized template
+            HEADER_TEXT_PARTS[1] = header_scanning_text
+            HEADER_TEXT_PARTS[3] = latency_color
+            HEADER_TEXT_PARTS[4] = str(avg_latency_rounded)
+            HEADER_TEXT_PARTS[8] = pluralize(tshark_restarted_times)
+            HEADER_TEXT_PARTS[10] = color_tshark_restarted_time
+            HEADER_TEXT_PARTS[11] = str(tshark_restarted_times)
+            HEADER_TEXT_PARTS[13] = pps_color
+            HEADER_TEXT_PARTS[14] = str(global_pps_rate)
+            HEADER_TEXT_PARTS[16] = rpc_message
 
             if any([invalid_ip_count, conflict_ip_count, corrupted_settings_count]):
-                header += "───────────────────────────────────────────────────────────────────────────────────────────────────<br>"
+                header_parts = [*HEADER_TEXT_PARTS, "───────────────────────────────────────────────────────────────────────────────────────────────────<br>"]
                 if invalid_ip_count:
-                    header += f"Number of invalid IP{pluralize(invalid_ip_count)} in UserIP file{pluralize(num_of_userip_files)}: <span style=\"color: red;\">{invalid_ip_count}</span><br>"
+                    header_parts.append(f"Number of invalid IP{pluralize(invalid_ip_count)} in UserIP file{pluralize(num_of_userip_files)}: <span style=\"color: red;\">{invalid_ip_count}</span><br>")
                 if conflict_ip_count:
-                    header += f"Number of conflicting IP{pluralize(conflict_ip_count)} in UserIP file{pluralize(num_of_userip_files)}: <span style=\"color: red;\">{conflict_ip_count}</span><br>"
+                    header_parts.append(f"Number of conflicting IP{pluralize(conflict_ip_count)} in UserIP file{pluralize(num_of_userip_files)}: <span style=\"color: red;\">{conflict_ip_count}</span><br>")
                 if corrupted_settings_count:
-                    header += f"Number of corrupted setting(s) in UserIP file{pluralize(num_of_userip_files)}: <span style=\"color: red;\">{corrupted_settings_count}</span><br>"
-                header += "───────────────────────────────────────────────────────────────────────────────────────────────────"
+                    header_parts.append(f"Number of corrupted setting(s) in UserIP file{pluralize(num_of_userip_files)}: <span style=\"color: red;\">{corrupted_settings_count}</span><br>")
+                header_parts.append("───────────────────────────────────────────────────────────────────────────────────────────────────")
+                header = "".join(header_parts)
+            else:
+                header = "".join(HEADER_TEXT_PARTS)
             return header, global_pps_last_update_time, global_pps_rate
 
+        import mmap
         from Modules.constants.standard import TWO_TAKE_ONE__PLUGIN__LOG_PATH, STAND__PLUGIN__LOG_PATH, RE_MODMENU_LOGS_USER_PATTERN
         from Modules.constants.local import CHERAX__PLUGIN__LOG_PATH
         from Modules.utils import concat_lists_no_duplicates
 
+        MODMENU_LOG_MMAP_THRESHOLD = 256 * 1024  # Reads of at least 256 KiB are done through mmap
+
+        def iter_modmenu_log_new_users(log_path: Path):
+            """Yields the `(ip, username)` pairs found in the lines appended to a mod menu log since its last read."""
+            try:
+                log_stat = log_path.stat()
+            except FileNotFoundError:
+                return
+
+            last_size, last_mtime_ns, read_offset = modmenu_logs_read_state.get(log_path, (-1, -1, 0))
+            if log_stat.st_size == last_size and log_stat.st_mtime_ns == last_mtime_ns:
+                return  # Skip unchanged files
+
+            if log_stat.st_size < read_offset:
+                read_offset = 0  # The log file got truncated or rotated, read it again from the start
+
+            # Only read the bytes appended since the last read, a partially written last line is left for the next read.
+            # Cheap pre-filter on the mandatory line prefix, so only candidate lines are decoded and matched against the regex.
+            candidate_lines: list[bytes] = []
+            with log_path.open("rb", buffering=65536) as log_file:
+                if log_stat.st_size - read_offset >= MODMENU_LOG_MMAP_THRESHOLD:
+                    # Large reads (e.g. the first read of a long log) are scanned in place, without copying the whole file into memory
+                    with mmap.mmap(log_file.fileno(), 0, access=mmap.ACCESS_READ) as log_mmap:
+                        last_newline_index = log_mmap.rfind(b"\n", read_offset, log_stat.st_size)
+                        read_end = read_offset if last_newline_index == -1 else last_newline_index + 1
+                        log_mmap.seek(read_offset)
+                        while log_mmap.tell() < read_end:
+                            raw_line = log_mmap.readline()
+                            if raw_line.startswith(b"user:"):
+                                candidate_lines.append(raw_line)
+                else:
+                    log_file.seek(read_offset)
+                    new_data = log_file.read(log_stat.st_size - read_offset)
+                    read_end = read_offset + new_data.rfind(b"\n") + 1
+                    candidate_lines = [raw_line for raw_line in new_data[:read_end - read_offset].splitlines() if raw_line.startswith(b"user:")]
+
+            modmenu_logs_read_state[log_path] = (log_stat.st_size, log_stat.st_mtime_ns, read_end)
+
+            for raw_line in candidate_lines:
+                line = raw_line.decode("utf-8", "replace").rstrip("\r\n")
+
+                match = RE_MODMENU_LOGS_USER_PATTERN.fullmatch(line)
+                if not match:
+                    continue
+
+                yield match.group("ip"), match.group("username")
+
         GUIrenderingData.FIELDS_TO_HIDE = set(Settings.GUI_FIELDS_TO_HIDE)
         (
             GUIrenderingData.GUI_CONNECTED_PLAYERS_TABLE__FIELD_NAMES,
@@ -3676,6 +3860,7 @@ def rendering_core():
 
         GUIrenderingData.SESSION_CONNECTED_TABLE__NUM_COLS = len(GUIrenderingData.GUI_CONNECTED_PLAYERS_TABLE__FIELD_NAMES)
         GUIrenderingData.SESSION_DISCONNECTED_TABLE__NUM_COLS = len(GUIrenderingData.GUI_DISCONNECTED_PLAYERS_TABLE__FIELD_NAMES)
+        GUIrenderingData.gui_field_names_ready_event.set()
         # Define the column name to index mapping for connected and disconnected players
         CONNECTED_COLUMN_MAPPING = {header: index for index, header in enumerate(GUIrenderingData.GUI_CONNECTED_PLAYERS_TABLE__FIELD_NAMES)}
         #DISCONNECTED_COLUMN_MAPPING = {header: index for index, header in enumerate(GUIrenderingData.GUI_DISCONNECTED_PLAYERS_TABLE__FIELD_NAMES)}
@@ -3693,7 +3878,69 @@ def rendering_core():
             discord_rpc_manager = DiscordRPC(client_id=DISCORD_APPLICATION_ID)
 
         modmenu__plugins__ip_to_usernames: dict[str, list[str]] = {}
-        file_mod_time_cache: dict[Path, float] = {}
+        modmenu__plugins__ip_to_usernames_set: dict[str, set[str]] = {}  # Mirrors `modmenu__plugins__ip_to_usernames` for O(1) membership checks
+        modmenu_logs_read_state: dict[Path, tuple[int, int, int]] = {}  # Maps each log path to its last seen (size, mtime_ns, read offset)
+        header_scanning_text_cache: Optional[tuple[tuple[str, ...], str]] = None
+        userip_files_parse_cache: dict[Path, tuple[tuple[int, int], Optional[UserIP_Settings], Optional[dict[str, list[str]]], set[str]]] = {}
+        userip_databases_files_signature: Optional[frozenset[tuple[Path, tuple[int, int]]]] = None
+        logging_field_names_with_sort_arrow_cache: dict[tuple[tuple[str, ...], str, Qt.SortOrder], tuple[str, ...]] = {}
+        logging_datetimes_format_cache: dict[datetime, str] = {}
+        gui_datetimes_format_cache: dict[tuple[datetime, bool, bool], str] = {}
+        logging_tables_render_cache: dict[str, tuple[tuple[str, tuple[str, ...], list[list[str]]], str]] = {}
+        last_session_logging_text: Optional[str] = None
+
+        HTML_SPAN_RED = '<span style="color: red;">'
+        HTML_SPAN_YELLOW = '<span style="color: yellow;">'
+        HTML_SPAN_GREEN = '<span style="color: green;">'
+
+        # Cell colors shared by every row, instead of constructing new `QColor` objects per player at each render
+        QCOLOR_WHITE = QColor("white")
+        QCOLOR_LIME = QColor("lime")
+        QCOLOR_RED = QColor("red")
+        QCOLOR_YELLOW = QColor("yellow")
+
+        ONE_MILLISECOND_TIMEDELTA = timedelta(milliseconds=1)
+
+        # Settings are only loaded at startup, so the latency thresholds are computed once
+        LATENCY_RED_THRESHOLD = 0.90 * Settings.CAPTURE_OVERFLOW_TIMER
+        LATENCY_YELLOW_THRESHOLD = 0.75 * Settings.CAPTURE_OVERFLOW_TIMER
+
+        # GUI header template, the empty strings are slots filled in by `generate_gui_header_text()` at each render
+        HEADER_TEXT_PARTS = [
+            f"""
+            <div style="background: linear-gradient(90deg, #2e3440, #4c566a); color: white; padding: 20px; border: 2px solid #88c0d0; border-radius: 8px; box-shadow: 0px 4px 10px rgba(0, 0, 0, 0.3);">
+                <div>
+                    <span style="font-size: 24px; color: #88c0d0">Welcome to {TITLE}</span>&nbsp;&nbsp;<span style="font-size: 14px; color: #aaa">{VERSION}</span>
+                </div>
+                <p style="font-size: 16px; margin: 5px 0;">
+                    The best FREE and Open-Source packet sniffer, aka IP grabber, works WITHOUT mods.
+                </p>
+                <p style="font-size: 14px; margin: 5px 0;">
+                    """,
+            "",  # [1] Scanning text
+            """
+                </p>
+                <p style="font-size: 14px; margin: 5px 0;">
+                    Packets latency per sec:""",
+            "",  # [3] Latency color
+            "",  # [4] Average latency
+            '</span>/<span style="color: green;">',
+            str(Settings.CAPTURE_OVERFLOW_TIMER),  # [6] Capture overflow timer
+            "</span> (tshark restart",
+            "",  # [8] TShark restarts plural suffix
+            ":",
+            "",  # [10] TShark restarts color
+            "",  # [11] TShark restarts count
+            "</span>) PPS:",
+            "",  # [13] PPS color
+            "",  # [14] PPS rate
+            "</span>",
+            "",  # [16] Discord RPC message
+            """
+                </p>
+            </div>
+            """
+        ]
 
         while not gui_closed__event.is_set():
             if ScriptControl.has_crashed():
@@ -3714,106 +3961,89 @@ def rendering_core():
                 last_mod_menus_logs_parse_time = time.monotonic()
 
                 for log_path in (STAND__PLUGIN__LOG_PATH, CHERAX__PLUGIN__LOG_PATH, TWO_TAKE_ONE__PLUGIN__LOG_PATH):
-                    if not log_path.is_file():
-                        continue
-
-                    # Check modification time
-                    mod_time = log_path.stat().st_mtime
-                    if file_mod_time_cache.get(log_path) == mod_time:
-                        continue  # Skip unchanged files
-
-                    file_mod_time_cache[log_path] = mod_time
-
-                    # Read the content and split it into lines
-                    for line in log_path.read_text(encoding="utf-8").splitlines():
-                        match = RE_MODMENU_LOGS_USER_PATTERN.fullmatch(line)
-                        if not match:
-                            continue
-
-                        username = match.group("username")
-                        if not isinstance(username, str):
-                            continue
-
-                        ip = match.group("ip")
-                        if not isinstance(ip, str):
-                            continue
-
-                        if username not in modmenu__plugins__ip_to_usernames.setdefault(ip, []):
-                            modmenu__plugins__ip_to_usernames[ip].append(username)
+                    for ip, username in iter_modmenu_log_new_users(log_path):
+                        ip_usernames_set = modmenu__plugins__ip_to_usernames_set.setdefault(ip, set())
+                        if username not in ip_usernames_set:
+                            ip_usernames_set.add(username)
+                            modmenu__plugins__ip_to_usernames.setdefault(ip, []).append(username)
 
             if last_userip_parse_time is None or time.monotonic() - last_userip_parse_time >= 1.0:
                 last_userip_parse_time = update_userip_databases(last_userip_parse_time)
 
-            if Settings.GUI_SESSIONS_LOGGING:
-                session_connected__padding_country_name = 0
-                session_connected__padding_continent_name = 0
-                session_disconnected__padding_country_name = 0
-                session_disconnected__padding_continent_name = 0
+            # Take the current time once for the whole players loop
+            now_datetime = datetime.now()
+            now_monotonic = time.monotonic()
+            # Precompute the per-player thresholds so that each check is a single comparison
+            disconnected_players_cutoff_datetime = now_datetime - timedelta(seconds=Settings.GUI_DISCONNECTED_PLAYERS_TIMER)
+            pps_update_cutoff_time = now_monotonic - 1.0
+            ppm_update_cutoff_time = now_monotonic - 60.0
+            are_session_connected_players_idle = True
 
             for player in PlayersRegistry.get_sorted_players():
-                if player.ip in UserIP_Databases.ips_set:
-                    UserIP_Databases.update_player_userip_info(player)
-                else:
+                if not UserIP_Databases.update_player_userip_info(player):
                     player.userip.reset()
 
                 if modmenu__plugins__ip_to_usernames and player.ip in modmenu__plugins__ip_to_usernames:
                     for username in modmenu__plugins__ip_to_usernames[player.ip]:
-                        if username not in player.mod_menus.usernames:
+                        if username not in player.mod_menus.usernames_set:
+                            player.mod_menus.usernames_set.add(username)
                             player.mod_menus.usernames.append(username)
 
-                player.usernames = concat_lists_no_duplicates(player.mod_menus.usernames, player.userip.usernames)
+                # Only rebuild the usernames when one of their sources changed (mod menus usernames are append-only)
+                if (
+                    len(player.mod_menus.usernames) != player.usernames_sources[0]
+                    or player.userip.usernames != player.usernames_sources[1]
+                ):
+                    player.usernames = concat_lists_no_duplicates(player.mod_menus.usernames, player.userip.usernames)
+                    player.usernames_sources = (len(player.mod_menus.usernames), player.userip.usernames)
 
                 if (
                     not player.datetime.left
-                    and (datetime.now() - player.datetime.last_seen).total_seconds() >= Settings.GUI_DISCONNECTED_PLAYERS_TIMER
+                    and player.datetime.last_seen <= disconnected_players_cutoff_datetime
                 ):
                     player.datetime.left = player.datetime.last_seen
                     if player.userip.detection.time:
                         player.userip.detection.as_processed_userip_task = False
-                        threading.Thread(target=process_userip_task, args=(player, "disconnected"), daemon=True).start()
+                        submit_userip_task(player, "disconnected")
 
                 if not player.iplookup.geolite2.is_initialized:
-                    player.iplookup.geolite2.country, player.iplookup.geolite2.country_code = get_country_info(player.ip)
-                    player.iplookup.geolite2.city = get_city_info(player.ip)
+                    player.iplookup.geolite2.country, player.iplookup.geolite2.country_code, player.iplookup.geolite2.city = get_country_and_city_info(player.ip)
                     player.iplookup.geolite2.asn = get_asn_info(player.ip)
 
                     player.iplookup.geolite2.is_initialized = True
 
                 if player.datetime.left:
                     session_disconnected.append(player)
-
-                    if Settings.GUI_SESSIONS_LOGGING:
-                        session_disconnected__padding_country_name = get_minimum_padding(player.iplookup.geolite2.country, session_disconnected__padding_country_name, 27)
-                        session_disconnected__padding_continent_name = get_minimum_padding(player.iplookup.ipapi.continent, session_disconnected__padding_continent_name, 13)
                 else:
                     session_connected.append(player)
 
-                    if Settings.GUI_SESSIONS_LOGGING:
-                        session_connected__padding_country_name = get_minimum_padding(player.iplookup.geolite2.country, session_connected__padding_country_name, 27)
-                        session_connected__padding_continent_name = get_minimum_padding(player.iplookup.ipapi.continent, session_connected__padding_continent_name, 13)
-
                     # Calculate PPS every second
-                    if (time.monotonic() - player.pps.last_update_time) >= 1.0:
-                        player.pps.rate = player.pps.counter  # Count of packets in the last second
-                        player.pps.update_average(player.pps.rate)
-                        player.pps.counter = 0
-                        player.pps.last_update_time = time.monotonic()
-                        player.pps.is_first_calculation = False
+                    player_pps = player.pps
+                    if player_pps.last_update_time <= pps_update_cutoff_time:
+                        player_pps.rate = player_pps.counter  # Count of packets in the last second
+                        player_pps.update_average(player_pps.rate)
+                        player_pps.counter = 0
+                        player_pps.last_update_time = now_monotonic
+                        player_pps.is_first_calculation = False
+                    if player_pps.is_first_calculation or player_pps.rate != 0:
+                        are_session_connected_players_idle = False
 
                     # Calculate PPM every minute
-                    if (time.monotonic() - player.ppm.last_update_time) >= 60.0:
-                        player.ppm.rate = player.ppm.counter  # Count of packets in the last minute
-                        player.ppm.update_average(player.ppm.rate)
-                        player.ppm.counter = 0
-                        player.ppm.last_update_time = time.monotonic()
-                        player.ppm.is_first_calculation = False
+                    player_ppm = player.ppm
+                    if player_ppm.last_update_time <= ppm_update_cutoff_time:
+                        player_ppm.rate = player_ppm.counter  # Count of packets in the last minute
+                        player_ppm.update_average(player_ppm.rate)
+                        player_ppm.counter = 0
+                        player_ppm.last_update_time = now_monotonic
+                        player_ppm.is_first_calculation = False
 
             if Settings.CAPTURE_PROGRAM_PRESET == "GTA5":
                 if SessionHost.player:
                     if SessionHost.player.datetime.left:
                         SessionHost.player = None
                 # TODO: We should also potentially needs to check that not more then 1s passed before each disconnected
-                if SessionHost.players_pending_for_disconnection and all(player.datetime.left for player in SessionHost.players_pending_for_disconnection):
+                # None of the pending players are connected anymore once they're disjoint from this tick's connected players
+                if SessionHost.players_pending_for_disconnection and SessionHost.players_pending_for_disconnection.isdisjoint(session_connected):
                     SessionHost.player = None
                     SessionHost.search_player = True
                     SessionHost.players_pending_for_disconnection.clear()
@@ -3822,8 +4052,8 @@ def rendering_core():
                     SessionHost.player = None
                     SessionHost.search_player = True
                     SessionHost.players_pending_for_disconnection.clear()
-                elif len(session_connected) >= 1 and all(not player.pps.is_first_calculation and player.pps.rate == 0 for player in session_connected):
-                    SessionHost.players_pending_for_disconnection = session_connected
+                elif len(session_connected) >= 1 and are_session_connected_players_idle:
+                    SessionHost.players_pending_for_disconnection = set(session_connected)
                 else:
                     if SessionHost.search_player:
                         SessionHost.get_host_player(session_connected)
@@ -3857,7 +4087,14 @@ def rendering_core():
             ) = process_gui_session_tables_rendering()
             GUIrenderingData.gui_rendering_ready_event.set()
 
-            gui_closed__event.wait(1)
+            process_pending_userip_tasks()
+
+            # Render again after 1 second, or sooner when a player joins or rejoins, coalescing bursts of joins over 100ms
+            if rendering_core__wakeup_event.wait(1):
+                gui_closed__event.wait(0.1)
+                # The sorted players cache is only refreshed every second, so rebuild it for the newly joined players to show up in this render
+                PlayersRegistry.refresh_sorted_cache()
+            rendering_core__wakeup_event.clear()
 
 cls()
 title(f"DEBUG CONSOLE - {TITLE}")
@@ -3883,6 +4120,14 @@ capture_core__thread = threading.Thread(target=capture_core, daemon=True)
 capture_core__thread.start()
 
 class SessionTableModel(QAbstractTableModel):
+    # Qt queries many roles per cell on each paint, only these ones are served by `data()`
+    _HANDLED_DATA_ROLES = frozenset({
+        Qt.ItemDataRole.DisplayRole,
+        Qt.ItemDataRole.ForegroundRole,
+        Qt.ItemDataRole.BackgroundRole,
+        Qt.ItemDataRole.ToolTipRole
+    })
+
     def __init__(self, headers: list[str], sort_column: int, sort_order: Qt.SortOrder):
         super().__init__()
         self._headers = headers  # The column headers
@@ -3891,7 +4136,10 @@ class SessionTableModel(QAbstractTableModel):
         # Custom Variables
         self._view: Optional[SessionTableView] = None  # Initially, no view is attached
         self._compiled_colors: list[list[CellColor]] = []  # The compiled colors for the table
-        self._IP_COLUMN_INDEX = self._headers.index("IP Address")
+        self._column_index_by_name = {header: column_index for column_index, header in enumerate(self._headers)}
+        self._IP_COLUMN_INDEX = self._column_index_by_name["IP Address"]
+        self._row_index_by_ip: Optional[dict[str, int]] = None  # Lazily rebuilt after any row reordering or removal
+        self._brush_cache: dict[int, QBrush] = {}  # Shared brushes by RGBA value, the tables only use a handful of colors
 
     def rowCount(self, parent=None):
         return len(self._data)  # The number of rows in the model
@@ -3901,6 +4149,10 @@ class SessionTableModel(QAbstractTableModel):
 
     def data(self, index, role: int):
         """Override data method to customize data retrieval and alignment."""
+        # Fast path for the roles that aren't customized, before touching the index or the data
+        if role not in self._HANDLED_DATA_ROLES:
+            return None
+
         if not index.isValid():
             return None
 
@@ -3908,22 +4160,25 @@ class SessionTableModel(QAbstractTableModel):
         col_idx = index.column()
 
         # Check bounds
-        if row_idx >= len(self._data) or col_idx >= len(self._data[row_idx]):
+        if row_idx >= len(self._data):
+            return None  # Return None for invalid index
+        row_data = self._data[row_idx]
+        if col_idx >= len(row_data):
             return None  # Return None for invalid index
 
         if role == Qt.ItemDataRole.DisplayRole:
             # Return the cell's text
-            return self._data[row_idx][col_idx]
+            return row_data[col_idx]
 
         if role == Qt.ItemDataRole.ForegroundRole:
             # Return the cell's foreground color
             if row_idx < len(self._compiled_colors) and col_idx < len(self._compiled_colors[row_idx]):
-                return QBrush(self._compiled_colors[row_idx][col_idx].foreground)
+                return self._get_brush(self._compiled_colors[row_idx][col_idx].foreground)
 
         if role == Qt.ItemDataRole.BackgroundRole:
             # Return the cell's background color
             if row_idx < len(self._compiled_colors) and col_idx < len(self._compiled_colors[row_idx]):
-                return QBrush(self._compiled_colors[row_idx][col_idx].background)
+                return self._get_brush(self._compiled_colors[row_idx][col_idx].background)
 
         if role == Qt.ItemDataRole.ToolTipRole:
             # Ensure the view is attached
@@ -3940,7 +4195,7 @@ class SessionTableModel(QAbstractTableModel):
             if resize_mode != QHeaderView.ResizeMode.Stretch:
                 return None
 
-            cell_text = self._data[row_idx][col_idx]
+            cell_text = row_data[col_idx]
 
             font_metrics = self._view.fontMetrics()
             text_width = font_metrics.horizontalAdvance(cell_text)
@@ -3953,8 +4208,6 @@ class SessionTableModel(QAbstractTableModel):
         return None
 
     def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
-        from Modules.constants.standalone import GUI_COLUMN_HEADERS_TOOLTIPS
-
         if orientation == Qt.Orientation.Horizontal:
             if role == Qt.ItemDataRole.DisplayRole:
                 return self._headers[section]  # Display the header name
@@ -3971,6 +4224,8 @@ class SessionTableModel(QAbstractTableModel):
 
         if role == Qt.ItemDataRole.EditRole:
             self._data[index.row()][index.column()] = value  # Set the data at the specified index
+            if index.column() == self._IP_COLUMN_INDEX:
+                self._row_index_by_ip = None
             self.dataChanged.emit(index, index, [Qt.ItemDataRole.DisplayRole])  # Notify the view of data change
             return True
 
@@ -4008,14 +4263,15 @@ class SessionTableModel(QAbstractTableModel):
         sort_order_bool = order == Qt.SortOrder.DescendingOrder
 
         if sorted_column_name == "IP Address":
-            import ipaddress
-
-            # Sort by IP address
+            # Sort by IP address, compared as 32-bit integers rather than through `ipaddress` objects
             combined.sort(
-                key=lambda row: ipaddress.ip_address(row[0][column].removesuffix(" 👑")),
+                key=lambda row: int.from_bytes(socket.inet_aton(row[0][column].removesuffix(" 👑")), "big"),
                 reverse=sort_order_bool
             )
         elif sorted_column_name in ("First Seen", "Last Rejoin", "Last Seen"):
+            # Retrieve the player datetime attribute for the selected column once, rather than for each row
+            get_player_datetime = attrgetter(Settings.gui_fields_mapping[sorted_column_name])
+
             # Retrieve the player datetime object from the IP column
             def extract_datetime_for_ip(ip: str):
                 """
@@ -4025,18 +4281,7 @@ class SessionTableModel(QAbstractTableModel):
                 if not isinstance(player, Player):
                     raise TypeError(f'Expected "Player", got "{type(player).__name__}"')
 
-                # Retrieve the player datetime attribute name for the selected column
-                # Mapping column names to player datetime attributes
-                datetime_attribute = {
-                    "First Seen": "first_seen",
-                    "Last Rejoin": "last_rejoin",
-                    "Last Seen": "last_seen"
-                }.get(self._headers[column], None)
-                if not isinstance(datetime_attribute, str):
-                    raise TypeError(f'Expected "str", got "{type(datetime_attribute).__name__}"')
-
-                # Safely retrieve the attribute using `getattr`
-                return getattr(player.datetime, datetime_attribute)
+                return get_player_datetime(player)
 
             combined.sort(
                 key=lambda row: extract_datetime_for_ip(row[0][self._IP_COLUMN_INDEX].removesuffix(" 👑")),
@@ -4054,6 +4299,7 @@ class SessionTableModel(QAbstractTableModel):
         # Unpack the sorted data
         self._data, self._compiled_colors = zip(*combined)
         self._data, self._compiled_colors = list(self._data), list(self._compiled_colors)
+        self._row_index_by_ip = None
 
         self.layoutChanged.emit()
 
@@ -4062,6 +4308,14 @@ class SessionTableModel(QAbstractTableModel):
     def set_view(self, view: "SessionTableView"):
         self._view = view
 
+    def _get_brush(self, color: QColor):
+        """Returns a cached `QBrush` for the given color, so brushes aren't reallocated for every painted cell."""
+        rgba = color.rgba()
+        brush = self._brush_cache.get(rgba)
+        if brush is None:
+            brush = self._brush_cache[rgba] = QBrush(color)
+        return brush
+
     def get_column_index(self, column_name: str):
         """
         Get the table index of a specified column.
@@ -4072,7 +4326,9 @@ class SessionTableModel(QAbstractTableModel):
         Returns:
             The table column index.
         """
-        column_index = self._headers.index(column_name)
+        column_index = self._column_index_by_name.get(column_name)
+        if column_index is None:
+            raise ValueError(f'"{column_name}" is not in the table headers')
 
         return column_index
 
@@ -4086,10 +4342,12 @@ class SessionTableModel(QAbstractTableModel):
         Returns:
             The index of the row containing the IP address, or None if not found.
         """
-        for row_index, row_data in enumerate(self._data):
-            if row_data[self._IP_COLUMN_INDEX].removesuffix(" 👑") == ip_address:
-                return row_index
-        return None
+        if self._row_index_by_ip is None:
+            self._row_index_by_ip = {
+                row_data[self._IP_COLUMN_INDEX].removesuffix(" 👑"): row_index
+                for row_index, row_data in enumerate(self._data)
+            }
+        return self._row_index_by_ip.get(ip_address)
 
     def sort_current_column(self):
         """
@@ -4120,6 +4378,8 @@ class SessionTableModel(QAbstractTableModel):
         # Only update internal data without triggering signals
         self._data.append(row_data)
         self._compiled_colors.append(row_colors)
+        if self._row_index_by_ip is not None:
+            self._row_index_by_ip[row_data[self._IP_COLUMN_INDEX].removesuffix(" 👑")] = len(self._data) - 1
 
     def update_row_without_refresh(self, row_index: int, row_data: list[str], row_colors: list[CellColor]):
         """
@@ -4166,6 +4426,7 @@ class SessionTableModel(QAbstractTableModel):
             # Remove the data and compiled colors at the specified index
             self._data.pop(row_index)
             self._compiled_colors.pop(row_index)
+            self._row_index_by_ip = None
 
             # Adjust selection for rows below the deleted one
             for index in selection_model.selection().indexes():
@@ -4209,6 +4470,8 @@ class SessionTableModel(QAbstractTableModel):
         self.layoutChanged.emit()
 
 class SessionTableView(QTableView):
+    _RESIZE_TO_CONTENTS_COLUMN_NAMES = frozenset({"First Seen", "Last Rejoin", "Last Seen", "Rejoins", "T. Packets", "Packets", "PPS", "Avg PPS", "PPM", "Avg PPM", "IP Address", "First Port", "Last Port", "Mobile", "VPN", "Hosting", "Pinging"})
+
     def __init__(self, model: SessionTableModel, sort_column: int, sort_order: Qt.SortOrder):
         super().__init__()
         self.setModel(model)
@@ -4366,20 +4629,21 @@ class SessionTableView(QTableView):
             header_label = model.headerData(column, Qt.Orientation.Horizontal, Qt.ItemDataRole.DisplayRole)
 
             if header_label == "Usernames":
-                # Check if the column contains any data other than "N/A"
-                contains_non_na = any(
-                    model.data(model.index(row, column), Qt.ItemDataRole.DisplayRole) != "N/A"
-                    for row in range(model.rowCount())
-                )
+                # Check if the column contains any data other than "N/A", reading the rows directly instead of going through `QModelIndex`
+                contains_non_na = any(row_data[column] != "N/A" for row_data in model._data)
 
                 if contains_non_na:
-                    header.setSectionResizeMode(column, QHeaderView.ResizeMode.Stretch)
+                    resize_mode = QHeaderView.ResizeMode.Stretch
                 else:
-                    header.setSectionResizeMode(column, QHeaderView.ResizeMode.ResizeToContents)
-            elif header_label in ("First Seen", "Last Rejoin", "Last Seen", "Rejoins", "T. Packets", "Packets", "PPS", "Avg PPS", "PPM", "Avg PPM", "IP Address", "First Port", "Last Port", "Mobile", "VPN", "Hosting", "Pinging"):
-                header.setSectionResizeMode(column, QHeaderView.ResizeMode.ResizeToContents)
+                    resize_mode = QHeaderView.ResizeMode.ResizeToContents
+            elif header_label in self._RESIZE_TO_CONTENTS_COLUMN_NAMES:
+                resize_mode = QHeaderView.ResizeMode.ResizeToContents
             else:
-                header.setSectionResizeMode(column, QHeaderView.ResizeMode.Stretch)
+                resize_mode = QHeaderView.ResizeMode.Stretch
+
+            # Setting a resize mode schedules a new layout (which measures every cell for `ResizeToContents`), so only do it when it changes
+            if header.sectionResizeMode(column) != resize_mode:
+                header.setSectionResizeMode(column, resize_mode)
 
     def get_sorted_column(self):
         """Get the currently sorted column and its order for this table view."""
@@ -4861,7 +5125,7 @@ class SessionTableView(QTableView):
             # Remove any lines containing the IP address
             lines_to_keep: list[str] = []
             for line in lines:
-                match = RE_USERIP_INI_PARSER_PATTERN.search(line)
+                match = RE_USERIP_INI_PARSER_PATTERN.match(line)
                 if match:
                     # Extract username and ip using named groups
                     username, ip = match.group("username").strip(), match.group("ip").strip()
@@ -4916,7 +5180,7 @@ class SessionTableView(QTableView):
             # Remove any lines containing the IP address
             lines_to_keep: list[str] = []
             for line in lines:
-                match = RE_USERIP_INI_PARSER_PATTERN.search(line)
+                match = RE_USERIP_INI_PARSER_PATTERN.match(line)
                 if match:
                     # Extract username and ip using named groups
                     username, ip = match.group("username").strip(), match.group("ip").strip()
@@ -5035,15 +5299,19 @@ class SessionTableView(QTableView):
         selection_model.select(selection, flag)
 
 class GUIWorkerThread(QThread):
+    # Signal to send updated table data and new size.
+    # The tables are passed as `object` so PyQt hands over the Python lists as-is, instead of deep-converting them to and from `QVariantList` on each emit.
     update_signal = pyqtSignal(
         str,
-        list,
-        list,
+        object,
+        object,
         int,
-        list,
-        list,
+        object,
+        object,
         int
-    )  # Signal to send updated table data and new size
+    )
+    # Signal to send only the header text, when the rendered tables are the same as the last ones sent.
+    update_header_signal = pyqtSignal(str)
 
     def __init__(self,
         connected_table_model: SessionTableModel,
@@ -5058,6 +5326,9 @@ class GUIWorkerThread(QThread):
         self.disconnected_table_model = disconnected_table_model
         self.disconnected_table_view = disconnected_table_view
 
+        # Immutable copy of the last tables sent, as the models keep (and may edit) the very lists they receive
+        self._last_emitted_tables_snapshot: Optional[tuple[tuple[tuple[Any, ...], ...], ...]] = None
+
     def run(self):
         # While the GUI is not closed, we repeat this loop
         while not gui_closed__event.is_set():
@@ -5071,6 +5342,19 @@ class GUIWorkerThread(QThread):
                 continue
             GUIrenderingData.gui_rendering_ready_event.clear()
 
+            # The header (global PPS, latency...) changes at almost every render, so it is left out of the comparison
+            tables_snapshot = (
+                tuple(map(tuple, GUIrenderingData.session_connected_table__processed_data)),
+                tuple(map(tuple, GUIrenderingData.session_connected_table__compiled_colors)),
+                tuple(map(tuple, GUIrenderingData.session_disconnected_table__processed_data)),
+                tuple(map(tuple, GUIrenderingData.session_disconnected_table__compiled_colors))
+            )
+            if tables_snapshot == self._last_emitted_tables_snapshot:
+                # Nothing to update, move, sort or resize in the tables
+                self.update_header_signal.emit(GUIrenderingData.header_text)
+                continue
+            self._last_emitted_tables_snapshot = tables_snapshot
+
             self.update_signal.emit(
                 GUIrenderingData.header_text,
                 GUIrenderingData.session_connected_table__processed_data,
@@ -5105,17 +5389,19 @@ class MainWindow(QMainWindow):
         self.header_text.setWordWrap(True)
         self.header_text.setFont(QFont("Courier", 10, QFont.Weight.Bold))
 
+        # Both session table headers share the same font instance
+        session_tables_header_font = QFont("Courier", 9, QFont.Weight.Bold)
+
         # Custom header for the Session Connected table with matching background as first column
         self.session_connected_header = QLabel(f"Players connected in your session (0):")
         self.session_connected_header.setTextFormat(Qt.TextFormat.RichText)
         self.session_connected_header.setStyleSheet("background-color: green; color: white; font-size: 16px; font-weight: bold; padding: 5px;")
         self.session_connected_header.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.session_connected_header.setFont(QFont("Courier", 9, QFont.Weight.Bold))
+        self.session_connected_header.setFont(session_tables_header_font)
 
         # Create the table model and view
         ## Determine the sort order
-        while not GUIrenderingData.GUI_CONNECTED_PLAYERS_TABLE__FIELD_NAMES:  # Wait for the GUI rendering data to be ready
-            gui_closed__event.wait(0.1)
+        GUIrenderingData.gui_field_names_ready_event.wait()  # Wait for the GUI rendering data to be ready
         _sort_column = GUIrenderingData.GUI_CONNECTED_PLAYERS_TABLE__FIELD_NAMES.index(Settings.GUI_FIELD_CONNECTED_PLAYERS_SORTED_BY)
         _sort_order = Qt.SortOrder.DescendingOrder
         self.connected_table_model = SessionTableModel(GUIrenderingData.GUI_CONNECTED_PLAYERS_TABLE__FIELD_NAMES, _sort_column, _sort_order)
@@ -5133,12 +5419,11 @@ class MainWindow(QMainWindow):
         self.session_disconnected_header.setTextFormat(Qt.TextFormat.RichText)
         self.session_disconnected_header.setStyleSheet("background-color: red; color: white; font-size: 16px; font-weight: bold; padding: 5px;")
         self.session_disconnected_header.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.session_disconnected_header.setFont(QFont("Courier", 9, QFont.Weight.Bold))
+        self.session_disconnected_header.setFont(session_tables_header_font)
 
         # Create the table model and view
         ## Determine the sort order
-        while not GUIrenderingData.GUI_DISCONNECTED_PLAYERS_TABLE__FIELD_NAMES:  # Wait for the GUI rendering data to be ready
-            gui_closed__event.wait(0.1)
+        GUIrenderingData.gui_field_names_ready_event.wait()  # Wait for the GUI rendering data to be ready
         _sort_column = GUIrenderingData.GUI_DISCONNECTED_PLAYERS_TABLE__FIELD_NAMES.index(Settings.GUI_FIELD_DISCONNECTED_PLAYERS_SORTED_BY)
         if Settings.GUI_FIELD_DISCONNECTED_PLAYERS_SORTED_BY in ("Last Rejoin", "Last Seen"):
             _sort_order = Qt.SortOrder.AscendingOrder
@@ -5169,12 +5454,15 @@ class MainWindow(QMainWindow):
             self.disconnected_table_view
         )
         self.worker_thread.update_signal.connect(self.update_gui)
+        self.worker_thread.update_header_signal.connect(self.update_header_text)
         self.worker_thread.start()
 
     def closeEvent(self, event: QCloseEvent):
         gui_closed__event.set()  # Signal the thread to stop
+        rendering_core__wakeup_event.set()  # Don't let the rendering thread finish its wait
         self.worker_thread.quit()  # Stop the QThread
         self.worker_thread.wait()  # Wait for the thread to finish
+        process_pending_userip_tasks()  # Don't leave any process suspended by a UserIP protection
         event.accept()  # Accept the close event
 
         terminate_script("EXIT")
@@ -5190,6 +5478,12 @@ class MainWindow(QMainWindow):
         elif screen_width >= 1024 and screen_height >= 768:
             self.resize(940, 680)
 
+    def update_header_text(self, header_text: str):
+        """Update the header text."""
+        # Setting a RichText label re-parses its HTML and re-lays out the window, so skip it when nothing changed
+        if header_text != self.header_text.text():
+            self.header_text.setText(header_text)
+
     def update_gui(self,
         header_text: str,
         session_connected_table__processed_data: list[list[str]],
@@ -5200,9 +5494,11 @@ class MainWindow(QMainWindow):
         session_disconnected_table__num_rows: int
     ):
         """Update header text and table data for connected and disconnected players."""
-        self.header_text.setText(header_text)
+        self.update_header_text(header_text)
 
-        self.session_connected_header.setText(f"Players connected in your session ({session_connected_table__num_rows}):")
+        session_connected_header_text = f"Players connected in your session ({session_connected_table__num_rows}):"
+        if session_connected_header_text != self.session_connected_header.text():
+            self.session_connected_header.setText(session_connected_header_text)
 
         for processed_data, compiled_colors in zip(session_connected_table__processed_data, session_connected_table__compiled_colors):
             ip_address = processed_data[self.connected_table_model._IP_COLUMN_INDEX].removesuffix(" 👑")
@@ -5220,7 +5516,9 @@ class MainWindow(QMainWindow):
         self.connected_table_model.sort_current_column()
         self.connected_table_view.adjust_table_column_widths()
 
-        self.session_disconnected_header.setText(f"Players who've left your session ({session_disconnected_table__num_rows}):")
+        session_disconnected_header_text = f"Players who've left your session ({session_disconnected_table__num_rows}):"
+        if session_disconnected_header_text != self.session_disconnected_header.text():
+            self.session_disconnected_header.setText(session_disconnected_header_text)
 
         for processed_data, compiled_colors in zip(session_disconnected_table__processed_data, session_disconnected_table__compiled_colors):
             ip_address = processed_data[self.disconnected_table_model._IP_COLUMN_INDEX].removesuffix(" 👑")